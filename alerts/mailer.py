@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import smtplib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+# 연결이 끊겨 실패한 메시지를 재연결 후 다시 보내는 횟수
+EMAIL_SEND_RETRIES = 1
+
+
+def build_email_message(user, subject: str, body: str) -> Optional[EmailMessage]:
+    if not user or not user.email:
+        return None
+    return EmailMessage(
+        subject,
+        body,
+        getattr(settings, "DEFAULT_FROM_EMAIL", None),
+        [user.email],
+    )
+
+
+def _reconnect(connection) -> None:
+    try:
+        connection.close()
+    except Exception:
+        pass
+    try:
+        connection.open()
+    except Exception:
+        # 다음 send_messages()에서 다시 연결을 시도
+        pass
+
+
+def _send_one(connection, message: EmailMessage) -> bool:
+    """
+    연결 오류일 때만 재연결 후 재발송
+    - 수신 거부/데이터 오류 등 SMTP 응답 오류는 서버가 이미 받았을 수 있으므로
+      재발송하지 않고 실패 처리
+    """
+    for _ in range(EMAIL_SEND_RETRIES + 1):
+        try:
+            return connection.send_messages([message]) == 1
+        except smtplib.SMTPServerDisconnected:
+            _reconnect(connection)
+        except smtplib.SMTPException:
+            # SMTPException도 OSError의 하위 클래스라 먼저 걸러냄
+            # (다음 메시지를 위해 연결 상태만 초기화)
+            _reconnect(connection)
+            return False
+        except OSError:
+            # ConnectionError, 소켓 타임아웃 등 연결 오류
+            _reconnect(connection)
+        except Exception:
+            _reconnect(connection)
+            return False
+    return False
+
+
+def _send_chunk(messages: List[EmailMessage]) -> List[bool]:
+    """
+    커넥션 하나를 열어 둔 채로 메시지를 순서대로 보낸다.
+    (send_messages()는 미리 열린 연결이면 닫지 않고 재사용)
+    """
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception:
+        pass
+
+    try:
+        return [_send_one(connection, message) for message in messages]
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+def send_email_messages(messages: List[Optional[EmailMessage]]) -> List[bool]:
+    """
+    메시지 목록을 EMAIL_SEND_CONNECTIONS개의 SMTP 연결로 나눠 병렬 발송한다.
+    반환: messages와 같은 순서의 성공 여부 (None 메시지는 False)
+    """
+    results = [False] * len(messages)
+    indexed = [(i, m) for i, m in enumerate(messages) if m is not None]
+    if not indexed:
+        return results
+
+    workers = max(1, min(getattr(settings, "EMAIL_SEND_CONNECTIONS", 2), len(indexed)))
+    size = -(-len(indexed) // workers)
+    chunks = [indexed[i : i + size] for i in range(0, len(indexed), size)]
+
+    if len(chunks) == 1:
+        sent = [_send_chunk([m for _, m in chunks[0]])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            sent = list(
+                executor.map(lambda chunk: _send_chunk([m for _, m in chunk]), chunks)
+            )
+
+    for chunk, chunk_results in zip(chunks, sent):
+        for (i, _), ok in zip(chunk, chunk_results):
+            results[i] = ok
+    return results
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+
+from alerts.matching import AlertIndex, CompiledAlertRule
+from auctions.models import AuctionItem
+
+BENCH_REGIONS = ["", "", "서울", "강남구", "부산", "경기 수원", "인천", "대구"]
+BENCH_LOCATIONS = [
+    "서울특별시 강남구 역삼동",
+    "부산광역시 해운대구 우동",
+    "경기도 수원시 영통구",
+    "인천광역시 남동구",
+    "대구광역시 수성구",
+    "강원도 춘천시",
+]
+
+
+class Command(BaseCommand):
+    help = "컴파일된 알림 규칙 매칭 속도를 합성 데이터로 측정합니다. (DB 사용 안 함)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--alerts", type=int, default=5000, help="알림 규칙 수")
+        parser.add_argument("--items", type=int, default=2000, help="매물 수")
+        parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+
+    def _rules(self, rnd: random.Random, count: int):
+        rules = []
+        for i in range(1, count + 1):
+            min_price = rnd.choice([None, None, 10_000_000, 50_000_000, 100_000_000])
+            max_price = rnd.choice([None, 30_000_000, 200_000_000, 500_000_000])
+            small_ids = rnd.sample(range(1, 30), rnd.choice([0, 0, 1, 2, 3]))
+            rules.append(
+                CompiledAlertRule(
+                    id=i,
+                    user_id=i % 1000,
+                    version=1,
+                    region=rnd.choice(BENCH_REGIONS).lower(),
+                    large_id=rnd.choice([None, None, 1, 2]),
+                    mid_id=rnd.choice([None, None, None, 1, 2, 3]),
+                    small_ids=frozenset(small_ids),
+                    min_price=min_price,
+                    max_price=max_price,
+                    min_failures=rnd.choice([0, 0, 0, 1, 2, 3]),
+                    notify_email=True,
+                    notify_telegram=False,
+                )
+            )
+        return rules
+
+    def _items(self, rnd: random.Random, count: int):
+        today = date.today()
+        return [
+            AuctionItem(
+                location=rnd.choice(BENCH_LOCATIONS),
+                large_id=rnd.choice([1, 2]),
+                middle_id=rnd.choice([1, 2, 3]),
+                small_id=rnd.randint(1, 29),
+                min_bid_price=rnd.randint(1, 60) * 10_000_000,
+                num_failures=rnd.randint(0, 4),
+                auction_date=today + timedelta(days=rnd.randint(0, 30)),
+            )
+            for _ in range(count)
+        ]
+
+    def handle(self, *args, **options):
+        rnd = random.Random(options["seed"])
+        rules = self._rules(rnd, options["alerts"])
+        items = self._items(rnd, options["items"])
+        pairs = len(items) * len(rules)
+
+        # 1) 모든 (매물, 규칙) 쌍을 컴파일된 규칙으로 직접 평가
+        started = time.perf_counter()
+        brute = 0
+        for item in items:
+            for rule in rules:
+                if rule.matches(item):
+                    brute += 1
+        brute_elapsed = time.perf_counter() - started
+
+        # 2) AlertIndex로 후보만 평가
+        started = time.perf_counter()
+        index = AlertIndex(rules)
+        build_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        indexed = sum(len(index.candidates(item)) for item in items)
+        index_elapsed = time.perf_counter() - started
+
+        # 3) 가격 하락(이전 가격 2배 → 현재 가격): 최대 가격 구간 bisect
+        started = time.perf_counter()
+        newly = sum(
+            len(
+                index.newly_matching(
+                    item, "min_bid_price", item.min_bid_price * 2, item.min_bid_price
+                )
+            )
+            for item in items
+        )
+        newly_elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"rules={len(rules)} items={len(items)} matched={brute} "
+            f"(index={indexed}, price drop newly matched={newly})"
+        )
+        self.stdout.write(
+            f"compiled rule : {pairs / brute_elapsed:,.0f} rule checks/s, "
+            f"{len(items) / brute_elapsed:,.1f} items/s ({brute_elapsed:.3f}s)"
+        )
+        self.stdout.write(
+            f"alert index   : {len(items) / index_elapsed:,.1f} items/s "
+            f"({index_elapsed:.3f}s, build {build_elapsed:.3f}s)"
+        )
+        self.stdout.write(
+            f"newly_matching: {len(items) / newly_elapsed:,.1f} items/s "
+            f"({newly_elapsed:.3f}s)"
+        )
@@ -0,0 +1,430 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Sequence
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from alerts.matching import get_alert_index
+from alerts.models import AlertBatchCheckpoint, AlertPreference, NotificationLog
+from alerts.services import (
+    find_matching_items_for_alert,
+    handle_item_events,
+    run_alert_batch,
+    run_alert_batch_sql,
+    sync_alert_rules,
+)
+from auctions.models import (
+    AuctionItem,
+    AuctionItemEvent,
+    CategoryLarge,
+    CategoryMiddle,
+    CategorySmall,
+)
+from users.models import TelegramProfile, User
+
+BENCH_ENGINES = ["find", "new_item", "batch_python", "batch_sql"]
+BENCH_BULK_SIZE = 5000
+
+# (대분류 수, 대분류당 중분류 수, 중분류당 소분류 수)
+BENCH_CATEGORY_SHAPE = (3, 4, 5)
+# 알림 지역 필터 (빈 문자열 = 전체)
+BENCH_REGIONS = [
+    "",
+    "",
+    "서울",
+    "강남구",
+    "부산",
+    "해운대구",
+    "경기",
+    "수원",
+    "인천",
+    "대구",
+]
+BENCH_LOCATIONS = [
+    "서울특별시 강남구 역삼동",
+    "서울특별시 마포구 합정동",
+    "부산광역시 해운대구 우동",
+    "경기도 수원시 영통구",
+    "경기도 성남시 분당구",
+    "인천광역시 남동구",
+    "대구광역시 수성구",
+    "강원도 춘천시",
+]
+# (최소가, 최대가) 가격대
+BENCH_PRICE_BANDS = [
+    (None, None),
+    (None, 100_000_000),
+    (50_000_000, 300_000_000),
+    (100_000_000, 500_000_000),
+    (300_000_000, None),
+]
+BENCH_FREQUENCIES = (
+    [AlertPreference.Frequency.IMMEDIATE] * 8
+    + [AlertPreference.Frequency.DAILY] * 3
+    + [AlertPreference.Frequency.WEEKLY]
+)
+
+
+class _QueryCounter:
+    # connection.execute_wrapper용: 실행된 쿼리 수만 센다 (DEBUG 로그 상한과 무관)
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _percentiles(latencies: List[float]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+
+    def at(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 3)
+
+    return {
+        "p50": at(0.50),
+        "p90": at(0.90),
+        "p99": at(0.99),
+        "max": round(ordered[-1] * 1000, 3),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "임시 테스트 DB에 합성 유저/알림/매물을 만들고 알림 매칭 엔진별 "
+        "처리량, 지연 시간 분위수, 쿼리 수를 JSON으로 출력합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10_000, help="유저 수")
+        parser.add_argument("--alerts", type=int, default=100_000, help="알림 수")
+        parser.add_argument("--items", type=int, default=5_000, help="매물 수")
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=200,
+            help="단건 측정(find/new_item)에 사용할 표본 수",
+        )
+        parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+        parser.add_argument(
+            "--engines",
+            type=str,
+            default=",".join(BENCH_ENGINES),
+            help=f"측정할 엔진 (쉼표 구분): {', '.join(BENCH_ENGINES)}",
+        )
+        parser.add_argument(
+            "--label", type=str, default="", help="결과에 함께 기록할 이름 (예: 커밋)"
+        )
+        parser.add_argument(
+            "--output", type=str, help="결과 JSON 파일 경로 (기본: stdout)"
+        )
+        parser.add_argument(
+            "--keepdb", action="store_true", help="임시 DB를 지우지 않고 재사용"
+        )
+
+    # ------------------------------------------------------------------
+    #  합성 데이터
+    # ------------------------------------------------------------------
+
+    def _create_categories(self) -> List[CategorySmall]:
+        larges, middles_per, smalls_per = BENCH_CATEGORY_SHAPE
+        smalls = []
+        for li in range(larges):
+            large = CategoryLarge.objects.create(code=f"L{li}", name=f"대분류{li}")
+            for mi in range(middles_per):
+                middle = CategoryMiddle.objects.create(
+                    large=large, code=f"M{mi}", name=f"중분류{li}-{mi}"
+                )
+                smalls.extend(
+                    CategorySmall.objects.bulk_create(
+                        CategorySmall(
+                            middle=middle, code=f"S{si}", name=f"소분류{li}-{mi}-{si}"
+                        )
+                        for si in range(smalls_per)
+                    )
+                )
+        return smalls
+
+    def _create_users(self, rnd: random.Random, count: int) -> List[User]:
+        users = User.objects.bulk_create(
+            [
+                User(email=f"bench{i}@example.com", name=f"bench{i}", password="!")
+                for i in range(count)
+            ],
+            batch_size=BENCH_BULK_SIZE,
+        )
+        # 10%는 텔레그램 연동 유저
+        TelegramProfile.objects.bulk_create(
+            [
+                TelegramProfile(user=user, chat_id=f"bench-{user.pk}")
+                for user in users
+                if rnd.random() < 0.1
+            ],
+            batch_size=BENCH_BULK_SIZE,
+        )
+        return users
+
+    def _create_alerts(
+        self,
+        rnd: random.Random,
+        users: Sequence[User],
+        smalls: Sequence[CategorySmall],
+        count: int,
+    ) -> List[AlertPreference]:
+        alerts = []
+        small_sets = []
+        for i in range(count):
+            min_price, max_price = rnd.choice(BENCH_PRICE_BANDS)
+            small = rnd.choice(smalls)
+            # 카테고리 조합: 없음 / 대분류 / 대+중분류 / 대+중+소분류
+            depth = rnd.choice([0, 1, 2, 2, 3, 3])
+            alerts.append(
+                AlertPreference(
+                    user=users[i % len(users)],
+                    region=rnd.choice(BENCH_REGIONS) or None,
+                    large_category_id=small.middle.large_id if depth >= 1 else None,
+                    mid_category_id=small.middle_id if depth >= 2 else None,
+                    min_price=min_price,
+                    max_price=max_price,
+                    min_failures=rnd.choice([None, None, 0, 1, 2]),
+                    notify_email=True,
+                    notify_telegram=rnd.random() < 0.2,
+                    frequency=rnd.choice(BENCH_FREQUENCIES),
+                )
+            )
+            small_sets.append(
+                rnd.sample(
+                    [s for s in smalls if s.middle_id == small.middle_id],
+                    rnd.randint(1, 2),
+                )
+                if depth == 3
+                else []
+            )
+
+        alerts = AlertPreference.objects.bulk_create(alerts, batch_size=BENCH_BULK_SIZE)
+        through = AlertPreference.small_categories.through
+        through.objects.bulk_create(
+            [
+                through(alertpreference_id=alert.pk, categorysmall_id=small.pk)
+                for alert, selected in zip(alerts, small_sets)
+                for small in selected
+            ],
+            batch_size=BENCH_BULK_SIZE,
+        )
+        # bulk_create는 시그널을 보내지 않으므로 SQL 엔진용 규칙 테이블을 직접 채움
+        ids = [alert.pk for alert in alerts]
+        for i in range(0, len(ids), BENCH_BULK_SIZE):
+            sync_alert_rules(ids[i : i + BENCH_BULK_SIZE])
+        return alerts
+
+    def _create_items(
+        self, rnd: random.Random, smalls: Sequence[CategorySmall], count: int
+    ) -> List[AuctionItem]:
+        today = date.today()
+        items = []
+        for i in range(count):
+            small = rnd.choice(smalls)
+            items.append(
+                AuctionItem(
+                    source=AuctionItem.Source.COURT,
+                    title=f"벤치 매물 {i}",
+                    location=rnd.choice(BENCH_LOCATIONS),
+                    min_bid_price=rnd.randint(1, 60) * 10_000_000,
+                    num_failures=rnd.randint(0, 4),
+                    auction_date=today + timedelta(days=rnd.randint(0, 60)),
+                    large_id=small.middle.large_id,
+                    middle_id=small.middle_id,
+                    small=small,
+                    external_id=f"bench-{i}",
+                    detail_url=f"https://example.com/items/{i}",
+                )
+            )
+        return AuctionItem.objects.bulk_create(items, batch_size=BENCH_BULK_SIZE)
+
+    # ------------------------------------------------------------------
+    #  측정
+    # ------------------------------------------------------------------
+
+    def _reset_results(self) -> None:
+        # 엔진 간 결과가 섞이지 않도록 발송 로그/평가 상태 초기화
+        NotificationLog.objects.all().delete()
+        AlertBatchCheckpoint.objects.all().delete()
+        AlertPreference.objects.update(
+            last_evaluated_at=None, evaluated_version=0, match_count=0
+        )
+
+    def _clear_data(self) -> None:
+        # keepdb로 재사용하는 경우 이전 실행 데이터 삭제 (같은 시드 → 같은 데이터)
+        NotificationLog.objects.all().delete()
+        AlertBatchCheckpoint.objects.all().delete()
+        AlertPreference.objects.all().delete()
+        AuctionItem.objects.all().delete()
+        User.objects.all().delete()
+        CategoryLarge.objects.all().delete()
+
+    def _measure_calls(self, func: Callable, args_list: List[tuple]) -> dict:
+        latencies = []
+        counter = _QueryCounter()
+        with connection.execute_wrapper(counter):
+            started = time.perf_counter()
+            for args in args_list:
+                call_started = time.perf_counter()
+                func(*args)
+                latencies.append(time.perf_counter() - call_started)
+            elapsed = time.perf_counter() - started
+
+        calls = len(args_list)
+        return {
+            "calls": calls,
+            "seconds": round(elapsed, 4),
+            "throughput_per_s": round(calls / elapsed, 2) if elapsed else None,
+            "latency_ms": _percentiles(latencies),
+            "queries": counter.count,
+            "queries_per_call": round(counter.count / calls, 2) if calls else None,
+        }
+
+    def _measure_batch(self, func: Callable) -> dict:
+        """
+        두 엔진 모두 같은 지표로 비교
+        (실행 후 notification_logs 상태별 개수와 초당 로그 수)
+        (엔진 반환값은 엔진마다 의미가 달라 쓰지 않음)
+        """
+        self._reset_results()
+        counter = _QueryCounter()
+        with connection.execute_wrapper(counter):
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+
+        by_status = dict(
+            NotificationLog.objects.order_by()
+            .values_list("status")
+            .annotate(count=Count("id"))
+        )
+        logs = sum(by_status.values())
+        return {
+            "seconds": round(elapsed, 4),
+            "notification_logs": logs,
+            "notification_logs_by_status": by_status,
+            "logs_per_s": round(logs / elapsed, 2) if elapsed else None,
+            "queries": counter.count,
+        }
+
+    def _run(self, options: dict, engines: List[str]) -> dict:
+        rnd = random.Random(options["seed"])
+        timings = {}
+
+        started = time.perf_counter()
+        smalls = self._create_categories()
+        users = self._create_users(rnd, options["users"])
+        alerts = self._create_alerts(rnd, users, smalls, options["alerts"])
+        items = self._create_items(rnd, smalls, options["items"])
+        timings["setup_seconds"] = round(time.perf_counter() - started, 3)
+
+        sample_size = min(options["samples"], len(alerts), len(items))
+        sample_rnd = random.Random(options["seed"] + 1)
+        results = {}
+
+        if "find" in engines:
+            sample = (
+                AlertPreference.objects.filter(
+                    id__in=[a.pk for a in sample_rnd.sample(alerts, sample_size)]
+                )
+                .prefetch_related("small_categories")
+                .order_by("id")
+            )
+            results["find_matching_items_for_alert"] = self._measure_calls(
+                lambda alert: list(find_matching_items_for_alert(alert)),
+                [(alert,) for alert in sample],
+            )
+
+        if "new_item" in engines:
+            self._reset_results()
+            started = time.perf_counter()
+            get_alert_index()  # 인덱스 빌드 (이후 호출은 프로세스 캐시 사용)
+            build_seconds = time.perf_counter() - started
+
+            # 운영 경로와 같이 신규 매물 이벤트 1건씩 handle_item_events로 처리
+            result = self._measure_calls(
+                handle_item_events,
+                [
+                    (
+                        [
+                            AuctionItemEvent(
+                                auction_item=item,
+                                event_type=AuctionItemEvent.Type.CREATED,
+                                changes={},
+                            )
+                        ],
+                    )
+                    for item in sample_rnd.sample(items, sample_size)
+                ],
+            )
+            result["index_build_seconds"] = round(build_seconds, 4)
+            result["notification_logs"] = NotificationLog.objects.count()
+            results["handle_item_events"] = result
+
+        if "batch_python" in engines:
+            results["run_alert_batch"] = self._measure_batch(run_alert_batch)
+        if "batch_sql" in engines:
+            results["run_alert_batch_sql"] = self._measure_batch(run_alert_batch_sql)
+
+        return {**timings, "results": results}
+
+    def handle(self, *args, **options):
+        engines = [e.strip() for e in options["engines"].split(",") if e.strip()]
+        unknown = sorted(set(engines) - set(BENCH_ENGINES))
+        if unknown:
+            raise CommandError(f"알 수 없는 엔진: {', '.join(unknown)}")
+
+        old_name = connection.settings_dict["NAME"]
+        # 실제 DB 대신 test_<DB명> 임시 DB를 만들어 마이그레이션 후 사용
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False, keepdb=options["keepdb"]
+        )
+        try:
+            # 외부 발송/공유 캐시를 건드리지 않도록
+            # 메일은 dummy, 텔레그램 비활성, 캐시는 로컬 메모리
+            with override_settings(
+                EMAIL_BACKEND="django.core.mail.backends.dummy.EmailBackend",
+                TELEGRAM_BOT_TOKEN="",
+                CACHES={
+                    "default": {
+                        "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
+                    }
+                },
+            ):
+                if options["keepdb"]:
+                    self._clear_data()
+                measured = self._run(options, engines)
+        finally:
+            connection.creation.destroy_test_db(
+                old_name, verbosity=0, keepdb=options["keepdb"]
+            )
+
+        report = {
+            "label": options["label"],
+            "created_at": timezone.now().isoformat(),
+            "params": {
+                key: options[key]
+                for key in ("users", "alerts", "items", "samples", "seed")
+            },
+            "engines": engines,
+            **measured,
+        }
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+        else:
+            self.stdout.write(output)
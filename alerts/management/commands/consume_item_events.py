@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from alerts.services import consume_alert_events
+from auctions.events import ITEM_EVENT_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = "매물 변경 이벤트를 읽어 알림 발송 대기 로그를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ITEM_EVENT_BATCH_SIZE,
+            help="한 번에 처리할 최대 이벤트 수",
+        )
+        parser.add_argument(
+            "--drain",
+            action="store_true",
+            help="처리할 이벤트가 없을 때까지 반복 실행",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+
+        while True:
+            count = consume_alert_events(batch_size)
+            total += count
+            if not options["drain"] or count < batch_size:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"매물 이벤트 {total}건 처리 완료"))
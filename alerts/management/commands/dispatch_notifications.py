@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from alerts.services import send_pending_notifications
+
+
+class Command(BaseCommand):
+    help = "PENDING 상태의 알림 로그를 이메일/텔레그램으로 발송합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=200,
+            help="한 번에 처리할 최대 로그 수",
+        )
+        parser.add_argument(
+            "--drain",
+            action="store_true",
+            help="대기 로그가 없을 때까지 반복 실행",
+        )
+
+    def handle(self, *args, **options):
+        limit = options["limit"]
+        total = 0
+
+        while True:
+            count = send_pending_notifications(limit=limit)
+            total += count
+            if not options["drain"] or count < limit:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"알림 {total}건 발송 처리 완료"))
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from alerts.services import reconcile_alert_match_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "알림별 매칭 매물 수(match_count)를 실제 매칭 결과로 다시 계산합니다. "
+        "(야간 크론용)"
+    )
+
+    def handle(self, *args, **options):
+        count = reconcile_alert_match_counts()
+        self.stdout.write(self.style.SUCCESS(f"알림 {count}개 매칭 수 재계산 완료"))
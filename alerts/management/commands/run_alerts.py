@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
-from alerts.services import run_alert_batch
+from alerts.services import run_alert_batch, run_alert_batch_sql
 
 
 class Command(BaseCommand):
@@ -15,10 +15,48 @@ class Command(BaseCommand):
             choices=["immediate", "daily", "weekly"],
             help="immediate / daily / weekly 중 하나를 선택하면 해당 주기만 실행",
         )
+        parser.add_argument(
+            "--shard",
+            type=str,
+            help="i/N 형식: user_id %% N == i 인 유저의 알림만 처리 (예: 0/4)",
+        )
+        parser.add_argument(
+            "--engine",
+            type=str,
+            choices=["python", "sql"],
+            default="python",
+            help=(
+                "python: 조건 그룹별 조회 후 메모리 매칭 / "
+                "sql: INSERT ... SELECT 한 문장으로 매칭"
+            ),
+        )
+
+    def _parse_shard(self, value):
+        if not value:
+            return None
+        try:
+            index, count = (int(v) for v in value.split("/"))
+        except ValueError:
+            raise CommandError("--shard는 i/N 형식이어야 합니다. (예: 0/4)")
+        if count < 1 or not 0 <= index < count:
+            raise CommandError("--shard 범위가 올바르지 않습니다. (0 <= i < N)")
+        return index, count
 
     def handle(self, *args, **options):
         freq = options.get("frequency")
-        count = run_alert_batch(freq)
+        shard = self._parse_shard(options.get("shard"))
+
+        if options["engine"] == "sql":
+            if shard:
+                raise CommandError("--shard는 python 엔진에서만 사용할 수 있습니다.")
+            count = run_alert_batch_sql(freq)
+            label = freq or "전체"
+            self.stdout.write(
+                self.style.SUCCESS(f"{label} 알림 로그 {count}건 생성 및 발송 완료")
+            )
+            return
+
+        count = run_alert_batch(freq, shard=shard)
 
         if freq:
             self.stdout.write(self.style.SUCCESS(f"{freq} 알림 {count}개 처리 완료"))
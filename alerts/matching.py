@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.core.cache import cache
+
+from alerts.models import AlertPreference
+from auctions.models import AuctionItem
+
+logger = logging.getLogger(__name__)
+
+ALERT_RULES_VERSION_KEY = "alerts:rules_version"
+
+
+def get_alert_rules_version() -> int:
+    return cache.get(ALERT_RULES_VERSION_KEY, 0)
+
+
+def bump_alert_rules_version() -> None:
+    """
+    알림 설정이 바뀌면 호출 → 프로세스마다 들고 있는 인덱스를 다음 조회 때 재빌드
+    """
+    try:
+        cache.incr(ALERT_RULES_VERSION_KEY)
+    except ValueError:
+        cache.set(ALERT_RULES_VERSION_KEY, 1, timeout=None)
+
+
+ITEMS_GENERATION_KEY = "alerts:items_generation"
+
+
+def get_items_generation() -> int:
+    return cache.get(ITEMS_GENERATION_KEY, 0)
+
+
+def bump_items_generation() -> None:
+    """
+    크롤링/상태 갱신으로 매물이 바뀌면 호출 → 캐시된 알림 미리보기를 모두 무효화
+    - 캐시 장애는 로그만 남기고 넘어감 (호출한 크롤링/상태 갱신 작업은 실패로 보지 않음)
+    """
+    try:
+        try:
+            cache.incr(ITEMS_GENERATION_KEY)
+        except ValueError:
+            cache.set(ITEMS_GENERATION_KEY, 1, timeout=None)
+    except Exception:
+        logger.exception(
+            "매물 세대 번호 갱신 실패 (알림 미리보기는 캐시 만료 시까지 유지)"
+        )
+
+
+class RegionMatcher:
+    """
+    알림 지역 문자열 전체를 Aho-Corasick 오토마톤으로 컴파일해
+    매물 소재지를 한 번 훑는 것으로 포함된 모든 지역 문자열을 찾는다.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern.lower())
+        self._build_fail_links()
+
+    def _add(self, pattern: str) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (pattern,)
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                # 실패 링크의 출력까지 합쳐 두면 탐색 시 링크를 다시 따라갈 필요 없음
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> Set[str]:
+        found: Set[str] = set()
+        state = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for ch in (text or "").lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class CompiledAlertRule:
+    """
+    AlertPreference 1개를 매칭용으로 컴파일한 불변 객체
+    - 지역은 소문자, 소분류는 frozenset, 가격/유찰은 int로 미리 정리
+    - matches()는 DB 접근 없이 비교 연산만 수행
+    """
+
+    __slots__ = (
+        "id",
+        "user_id",
+        "version",
+        "region",
+        "large_id",
+        "mid_id",
+        "small_ids",
+        "min_price",
+        "max_price",
+        "min_failures",
+        "notify_email",
+        "notify_telegram",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        user_id: int,
+        version: int,
+        region: str,
+        large_id: Optional[int],
+        mid_id: Optional[int],
+        small_ids: frozenset,
+        min_price: Optional[int],
+        max_price: Optional[int],
+        min_failures: int,
+        notify_email: bool,
+        notify_telegram: bool,
+    ):
+        set_ = object.__setattr__
+        set_(self, "id", id)
+        set_(self, "user_id", user_id)
+        set_(self, "version", version)
+        set_(self, "region", region)  # 소문자, 없으면 ""
+        set_(self, "large_id", large_id)
+        set_(self, "mid_id", mid_id)
+        set_(self, "small_ids", small_ids)
+        set_(self, "min_price", min_price)
+        set_(self, "max_price", max_price)
+        set_(self, "min_failures", min_failures)  # 0이면 조건 없음
+        set_(self, "notify_email", notify_email)
+        set_(self, "notify_telegram", notify_telegram)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledAlertRule은 변경할 수 없습니다.")
+
+    def __repr__(self) -> str:
+        return f"CompiledAlertRule(id={self.id}, version={self.version})"
+
+    @classmethod
+    def from_preference(cls, alert: AlertPreference) -> "CompiledAlertRule":
+        # small_categories는 prefetch된 상태로 넘겨야 쿼리가 추가로 나가지 않음
+        return cls(
+            id=alert.id,
+            user_id=alert.user_id,
+            version=alert.version,
+            region=(alert.region or "").strip().lower(),
+            large_id=alert.large_category_id,
+            mid_id=alert.mid_category_id,
+            small_ids=frozenset(c.id for c in alert.small_categories.all()),
+            min_price=alert.min_price,
+            max_price=alert.max_price,
+            min_failures=alert.min_failures or 0,
+            notify_email=alert.notify_email,
+            notify_telegram=alert.notify_telegram,
+        )
+
+    def matches(self, item: AuctionItem, regions: Optional[Set[str]] = None) -> bool:
+        """
+        경매일을 제외한 알림 조건을 DB 접근 없이 평가
+        - regions: RegionMatcher로 찾은 소재지 포함 지역 집합 (있으면 문자열 검색 생략)
+        """
+        if self.region:
+            if regions is not None:
+                if self.region not in regions:
+                    return False
+            else:
+                location = item.location
+                if not location or self.region not in location.lower():
+                    return False
+        if self.large_id is not None and self.large_id != item.large_id:
+            return False
+        if self.mid_id is not None and self.mid_id != item.middle_id:
+            return False
+        if self.small_ids and item.small_id not in self.small_ids:
+            return False
+        price = item.min_bid_price
+        if self.min_price is not None and (price is None or price < self.min_price):
+            return False
+        if self.max_price is not None and (price is None or price > self.max_price):
+            return False
+        if self.min_failures:
+            failures = item.num_failures
+            if failures is None or failures < self.min_failures:
+                return False
+        return True
+
+
+def is_upcoming(item: AuctionItem) -> bool:
+    """
+    경매일이 오늘 이후인 매물인지 (경매일 없는 매물은 제외 - 일괄 매칭 쿼리와 동일)
+    """
+    return item.auction_date is not None and item.auction_date >= date.today()
+
+
+# 프로세스 단위 컴파일 결과 캐시: {alert_id: CompiledAlertRule}
+_compiled_rules: Dict[int, CompiledAlertRule] = {}
+
+
+def compile_alert_rule(alert: AlertPreference) -> CompiledAlertRule:
+    """
+    설정 버전(AlertPreference.version)이 같으면 이전에 컴파일한 규칙을 재사용
+    """
+    rule = _compiled_rules.get(alert.id)
+    if rule is None or rule.version != alert.version:
+        rule = CompiledAlertRule.from_preference(alert)
+        _compiled_rules[alert.id] = rule
+    return rule
+
+
+class AlertIndex:
+    """
+    활성 알림 조건 전체를 메모리에 올려 두고 매물 1건에 대해 후보 알림만 골라낸다.
+
+    - 소분류 id / 지역 → 알림 id 버킷 (조건 없는 알림은 별도 집합)
+    - 지역은 인덱스마다 1번 컴파일한 RegionMatcher로 소재지를 한 번만 훑어서 찾음
+    - 최소/최대 가격, 최소 유찰 횟수는 정렬 배열 + bisect로 조건을 만족하는 개수를 계산
+    - 가장 선택도가 높은(후보가 적은) 차원 하나만 펼친 뒤 나머지는 비교 연산으로 검증
+    """
+
+    def __init__(self, alerts: Iterable[CompiledAlertRule]):
+        self.alerts: Dict[int, CompiledAlertRule] = {}
+
+        self._by_small: Dict[int, Set[int]] = {}
+        self._any_small: Set[int] = set()
+        self._by_region: Dict[str, Set[int]] = {}
+        self._any_region: Set[int] = set()
+
+        min_prices: List[Tuple[int, int]] = []
+        max_prices: List[Tuple[int, int]] = []
+        min_failures: List[Tuple[int, int]] = []
+        self._no_min_price: Set[int] = set()
+        self._no_max_price: Set[int] = set()
+        self._no_min_failures: Set[int] = set()
+
+        for alert in alerts:
+            self.alerts[alert.id] = alert
+
+            if alert.small_ids:
+                for small_id in alert.small_ids:
+                    self._by_small.setdefault(small_id, set()).add(alert.id)
+            else:
+                self._any_small.add(alert.id)
+
+            if alert.region:
+                self._by_region.setdefault(alert.region, set()).add(alert.id)
+            else:
+                self._any_region.add(alert.id)
+
+            if alert.min_price is not None:
+                min_prices.append((alert.min_price, alert.id))
+            else:
+                self._no_min_price.add(alert.id)
+
+            if alert.max_price is not None:
+                max_prices.append((alert.max_price, alert.id))
+            else:
+                self._no_max_price.add(alert.id)
+
+            if alert.min_failures:
+                min_failures.append((alert.min_failures, alert.id))
+            else:
+                self._no_min_failures.add(alert.id)
+
+        self._region_matcher = RegionMatcher(self._by_region)
+
+        min_prices.sort()
+        max_prices.sort()
+        min_failures.sort()
+        self._min_price_keys = [v for v, _ in min_prices]
+        self._min_price_ids = [i for _, i in min_prices]
+        self._max_price_keys = [v for v, _ in max_prices]
+        self._max_price_ids = [i for _, i in max_prices]
+        self._min_failures_keys = [v for v, _ in min_failures]
+        self._min_failures_ids = [i for _, i in min_failures]
+
+    def __len__(self) -> int:
+        return len(self.alerts)
+
+    def _region_ids(self, regions: Set[str]) -> Set[int]:
+        ids: Set[int] = set()
+        for region in regions:
+            ids |= self._by_region[region]
+        return ids
+
+    def candidates(self, item: AuctionItem) -> List[CompiledAlertRule]:
+        """
+        item과 매칭되는 알림 목록 (알림 id 오름차순)
+        """
+        if not self.alerts or not is_upcoming(item):
+            return []
+
+        price = item.min_bid_price
+        failures = item.num_failures or 0
+
+        # 차원별 (예상 후보 수, 후보 id 생성 함수)
+        small_ids = self._by_small.get(item.small_id, set()) if item.small_id else set()
+        regions = self._region_matcher.find_all(item.location)
+        region_ids = self._region_ids(regions)
+        dims = [
+            (
+                len(region_ids) + len(self._any_region),
+                lambda: region_ids | self._any_region,
+            ),
+            (
+                len(small_ids) + len(self._any_small),
+                lambda: small_ids | self._any_small,
+            ),
+            (
+                len(self._no_min_failures)
+                + bisect_right(self._min_failures_keys, failures),
+                lambda: self._no_min_failures.union(
+                    self._min_failures_ids[
+                        : bisect_right(self._min_failures_keys, failures)
+                    ]
+                ),
+            ),
+        ]
+        if price is None:
+            dims.append(
+                (
+                    len(self._no_min_price),
+                    lambda: self._no_min_price & self._no_max_price,
+                )
+            )
+        else:
+            min_cut = bisect_right(self._min_price_keys, price)
+            max_cut = bisect_left(self._max_price_keys, price)
+            dims.append(
+                (
+                    len(self._no_min_price) + min_cut,
+                    lambda: self._no_min_price.union(self._min_price_ids[:min_cut]),
+                )
+            )
+            dims.append(
+                (
+                    len(self._no_max_price) + len(self._max_price_ids) - max_cut,
+                    lambda: self._no_max_price.union(self._max_price_ids[max_cut:]),
+                )
+            )
+
+        _, build = min(dims, key=lambda d: d[0])
+        candidate_ids = build()
+
+        return [
+            self.alerts[alert_id]
+            for alert_id in sorted(candidate_ids)
+            if self.alerts[alert_id].matches(item, regions)
+        ]
+
+    def newly_matching(
+        self, item: AuctionItem, field: str, old, new
+    ) -> List[CompiledAlertRule]:
+        """
+        field 값이 old → new로 바뀌면서 새로 조건을 만족하게 된 알림만 반환
+        - 가격 하락: 최대 가격이 [new, old) 구간인 알림
+        - 가격 상승: 최소 가격이 (old, new] 구간인 알림
+        - 유찰 증가: 최소 유찰 횟수가 (old, new] 구간인 알림
+        (이전 값이 없으면 전체 후보로 처리)
+        """
+        if not self.alerts or not is_upcoming(item):
+            return []
+
+        ids: List[int] = []
+        if field == "min_bid_price":
+            if old is None:
+                return self.candidates(item)
+            if new is None:
+                return []
+            if new < old:
+                ids = self._max_price_ids[
+                    bisect_left(self._max_price_keys, new) : bisect_left(
+                        self._max_price_keys, old
+                    )
+                ]
+            elif new > old:
+                ids = self._min_price_ids[
+                    bisect_right(self._min_price_keys, old) : bisect_right(
+                        self._min_price_keys, new
+                    )
+                ]
+        elif field == "num_failures":
+            old, new = old or 0, new or 0
+            if new > old:
+                ids = self._min_failures_ids[
+                    bisect_right(self._min_failures_keys, old) : bisect_right(
+                        self._min_failures_keys, new
+                    )
+                ]
+        if not ids:
+            return []
+
+        regions = self._region_matcher.find_all(item.location)
+        return [
+            self.alerts[alert_id]
+            for alert_id in sorted(set(ids))
+            if self.alerts[alert_id].matches(item, regions)
+        ]
+
+
+def build_alert_index() -> AlertIndex:
+    alerts = AlertPreference.objects.filter(is_active=True).prefetch_related(
+        "small_categories"
+    )
+    rules = [compile_alert_rule(alert) for alert in alerts]
+
+    # 비활성/삭제된 알림의 컴파일 결과 정리
+    active_ids = {rule.id for rule in rules}
+    for alert_id in list(_compiled_rules):
+        if alert_id not in active_ids:
+            del _compiled_rules[alert_id]
+
+    return AlertIndex(rules)
+
+
+_index_cache: Dict[str, object] = {"version": None, "index": None}
+
+
+def get_alert_index() -> AlertIndex:
+    """
+    프로세스 단위로 인덱스를 재사용하고, 알림 설정 버전이 바뀐 경우에만 재빌드한다.
+    """
+    version = get_alert_rules_version()
+    if _index_cache["index"] is None or _index_cache["version"] != version:
+        _index_cache["index"] = build_alert_index()
+        _index_cache["version"] = version
+    return _index_cache["index"]
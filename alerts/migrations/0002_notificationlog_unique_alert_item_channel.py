@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:20
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, Count, IntegerField, Value, When
+
+
+def dedupe_notification_logs(apps, schema_editor):
+    """
+    제약 추가 전 (alert, auction_item, channel) 중복 로그 정리
+    - 발송 성공 로그 우선, 같으면 먼저 생성된 로그 1건만 남김
+    """
+    NotificationLog = apps.get_model("alerts", "NotificationLog")
+
+    duplicates = (
+        NotificationLog.objects.filter(alert__isnull=False)
+        .values("alert_id", "auction_item_id", "channel")
+        .annotate(cnt=Count("id"))
+        .filter(cnt__gt=1)
+    )
+
+    for dup in duplicates.iterator():
+        ids = list(
+            NotificationLog.objects.filter(
+                alert_id=dup["alert_id"],
+                auction_item_id=dup["auction_item_id"],
+                channel=dup["channel"],
+            )
+            .annotate(
+                priority=Case(
+                    When(status="success", then=Value(0)),
+                    default=Value(1),
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by("priority", "id")
+            .values_list("id", flat=True)
+        )
+        NotificationLog.objects.filter(id__in=ids[1:]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0001_initial"),
+        ("auctions", "0005_auctionitem_refresh_schedule"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_notification_logs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="notificationlog",
+            constraint=models.UniqueConstraint(
+                fields=("alert", "auction_item", "channel"),
+                name="uniq_notification_alert_item_channel",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0002_notificationlog_unique_alert_item_channel"),
+        ("auctions", "0005_auctionitem_refresh_schedule"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notificationlog",
+            index=models.Index(
+                condition=models.Q(("status", "success")),
+                fields=["alert", "auction_item"],
+                name="notif_log_alert_item_sent_idx",
+            ),
+        ),
+    ]
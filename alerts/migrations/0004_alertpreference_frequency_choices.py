@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0003_notificationlog_sent_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="alertpreference",
+            name="frequency",
+            field=models.CharField(
+                choices=[
+                    ("immediate", "즉시"),
+                    ("daily", "매일 요약"),
+                    ("weekly", "매주 요약"),
+                ],
+                default="immediate",
+                max_length=20,
+                verbose_name="알림 빈도",
+            ),
+        ),
+    ]
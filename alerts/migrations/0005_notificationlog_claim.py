@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0004_alertpreference_frequency_choices"),
+        ("auctions", "0005_auctionitem_refresh_schedule"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notificationlog",
+            name="claimed_until",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="발송 점유 만료 시각"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notificationlog",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "발송 대기"),
+                    ("sending", "발송 중"),
+                    ("success", "발송 성공"),
+                    ("failed", "발송 실패"),
+                ],
+                default="pending",
+                max_length=20,
+                verbose_name="상태",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notificationlog",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "sending"])),
+                fields=["status", "created_at"],
+                name="notif_log_dispatch_idx",
+            ),
+        ),
+    ]
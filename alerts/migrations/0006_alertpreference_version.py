@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0005_notificationlog_claim"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="alertpreference",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=1, editable=False, verbose_name="설정 버전"
+            ),
+        ),
+    ]
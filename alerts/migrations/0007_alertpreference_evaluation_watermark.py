@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0006_alertpreference_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="alertpreference",
+            name="evaluated_version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="평가 당시 설정 버전"
+            ),
+        ),
+        migrations.AddField(
+            model_name="alertpreference",
+            name="last_evaluated_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="마지막 평가 시각"
+            ),
+        ),
+    ]
@@ -0,0 +1,153 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:35
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_alert_rules(apps, schema_editor):
+    """
+    기존 알림 설정으로 alert_rules 초기 데이터 생성 (이후는 signals에서 동기화)
+    """
+    AlertPreference = apps.get_model("alerts", "AlertPreference")
+    AlertRule = apps.get_model("alerts", "AlertRule")
+
+    rules = [
+        AlertRule(
+            alert_id=alert.id,
+            user_id=alert.user_id,
+            is_active=alert.is_active,
+            frequency=alert.frequency,
+            region=(alert.region or "").strip().lower(),
+            large_id=alert.large_category_id,
+            mid_id=alert.mid_category_id,
+            small_ids=sorted(c.id for c in alert.small_categories.all()),
+            min_price=alert.min_price,
+            max_price=alert.max_price,
+            min_failures=alert.min_failures or 0,
+            notify_email=alert.notify_email,
+            notify_telegram=alert.notify_telegram,
+            version=alert.version,
+        )
+        for alert in AlertPreference.objects.prefetch_related("small_categories")
+    ]
+    AlertRule.objects.bulk_create(rules, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0007_alertpreference_evaluation_watermark"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AlertRule",
+            fields=[
+                (
+                    "alert",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rule",
+                        serialize=False,
+                        to="alerts.alertpreference",
+                        verbose_name="알림 설정",
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="알림 사용 여부"),
+                ),
+                (
+                    "frequency",
+                    models.CharField(max_length=20, verbose_name="알림 빈도"),
+                ),
+                (
+                    "region",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=200,
+                        verbose_name="지역(소문자)",
+                    ),
+                ),
+                (
+                    "large_id",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="대분류 ID"
+                    ),
+                ),
+                (
+                    "mid_id",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="중분류 ID"
+                    ),
+                ),
+                (
+                    "small_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(),
+                        blank=True,
+                        default=list,
+                        size=None,
+                        verbose_name="소분류 ID 목록",
+                    ),
+                ),
+                (
+                    "min_price",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="최소 희망 입찰가"
+                    ),
+                ),
+                (
+                    "max_price",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="최대 희망 입찰가"
+                    ),
+                ),
+                (
+                    "min_failures",
+                    models.IntegerField(default=0, verbose_name="최소 유찰 횟수"),
+                ),
+                (
+                    "notify_email",
+                    models.BooleanField(default=True, verbose_name="이메일 알림 여부"),
+                ),
+                (
+                    "notify_telegram",
+                    models.BooleanField(
+                        default=False, verbose_name="텔레그램 알림 여부"
+                    ),
+                ),
+                (
+                    "version",
+                    models.PositiveIntegerField(default=1, verbose_name="설정 버전"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="유저",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "알림 매칭 규칙",
+                "verbose_name_plural": "알림 매칭 규칙 목록",
+                "db_table": "alert_rules",
+                "indexes": [
+                    models.Index(
+                        fields=["is_active", "frequency"],
+                        name="alert_rule_active_freq_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_alert_rules, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0008_alert_rules"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AlertBatchCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "frequency",
+                    models.CharField(
+                        blank=True, default="", max_length=20, verbose_name="알림 빈도"
+                    ),
+                ),
+                (
+                    "shard_index",
+                    models.PositiveIntegerField(default=0, verbose_name="샤드 번호"),
+                ),
+                (
+                    "shard_count",
+                    models.PositiveIntegerField(default=1, verbose_name="샤드 수"),
+                ),
+                (
+                    "last_alert_id",
+                    models.BigIntegerField(
+                        default=0, verbose_name="마지막 처리 알림 ID"
+                    ),
+                ),
+                (
+                    "processed",
+                    models.IntegerField(default=0, verbose_name="처리한 알림 수"),
+                ),
+                ("started_at", models.DateTimeField(verbose_name="실행 시작 시각")),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="실행 종료 시각"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "알림 배치 체크포인트",
+                "verbose_name_plural": "알림 배치 체크포인트 목록",
+                "db_table": "alert_batch_checkpoints",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("frequency", "shard_index", "shard_count"),
+                        name="uniq_alert_batch_checkpoint_shard",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0009_alert_batch_checkpoint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="alertpreference",
+            name="match_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="매칭 매물 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="alertpreference",
+            name="match_count_reconciled_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="매칭 수 재계산 시각"
+            ),
+        ),
+    ]
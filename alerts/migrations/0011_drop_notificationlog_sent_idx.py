@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:08
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alerts", "0010_alertpreference_match_count"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="notificationlog",
+            name="notif_log_alert_item_sent_idx",
+        ),
+    ]
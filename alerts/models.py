@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 
 from auctions.models import AuctionItem, CategoryLarge, CategoryMiddle, CategorySmall
@@ -6,6 +7,11 @@ from core.models import TimeStampedModel
 
 
 class AlertPreference(TimeStampedModel):
+    class Frequency(models.TextChoices):
+        IMMEDIATE = "immediate", "즉시"
+        DAILY = "daily", "매일 요약"
+        WEEKLY = "weekly", "매주 요약"
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -46,8 +52,25 @@ class AlertPreference(TimeStampedModel):
     notify_email = models.BooleanField("이메일 알림 여부", default=True)
     notify_telegram = models.BooleanField("텔레그램 알림 여부", default=False)
 
-    frequency = models.CharField("알림 빈도", max_length=20, default="immediate")
+    frequency = models.CharField(
+        "알림 빈도",
+        max_length=20,
+        choices=Frequency.choices,
+        default=Frequency.IMMEDIATE,
+    )
     is_active = models.BooleanField("알림 사용 여부", default=True)
+    # 저장/소분류 변경 시마다 증가 (미리보기 캐시 키에 사용)
+    version = models.PositiveIntegerField("설정 버전", default=1, editable=False)
+    # run_alert_batch 증분 평가 기준 (이 시각 이후 바뀐 매물만 매칭)
+    last_evaluated_at = models.DateTimeField("마지막 평가 시각", null=True, blank=True)
+    evaluated_version = models.PositiveIntegerField(
+        "평가 당시 설정 버전", default=0, editable=False
+    )
+    # 현재 매칭되는(미발송) 매물 수: 이벤트/발송 시 증감, 야간 배치에서 재계산
+    match_count = models.IntegerField("매칭 매물 수", default=0, editable=False)
+    match_count_reconciled_at = models.DateTimeField(
+        "매칭 수 재계산 시각", null=True, blank=True
+    )
 
     class Meta:
         db_table = "alert_preferences"
@@ -58,6 +81,94 @@ class AlertPreference(TimeStampedModel):
         return f"{self.user.email} 알림 설정 #{self.id}"
 
 
+class AlertRule(models.Model):
+    """
+    AlertPreference를 SQL 일괄 매칭용으로 펼쳐 둔 테이블 (signals에서 동기화)
+    - 지역은 소문자, 소분류는 id 배열, 유찰 조건 없음은 0
+    """
+
+    alert = models.OneToOneField(
+        AlertPreference,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="rule",
+        verbose_name="알림 설정",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="유저",
+    )
+    is_active = models.BooleanField("알림 사용 여부", default=True)
+    frequency = models.CharField("알림 빈도", max_length=20)
+
+    region = models.CharField("지역(소문자)", max_length=200, blank=True, default="")
+    large_id = models.BigIntegerField("대분류 ID", null=True, blank=True)
+    mid_id = models.BigIntegerField("중분류 ID", null=True, blank=True)
+    small_ids = ArrayField(
+        models.BigIntegerField(),
+        verbose_name="소분류 ID 목록",
+        default=list,
+        blank=True,
+    )
+    min_price = models.BigIntegerField("최소 희망 입찰가", null=True, blank=True)
+    max_price = models.BigIntegerField("최대 희망 입찰가", null=True, blank=True)
+    min_failures = models.IntegerField("최소 유찰 횟수", default=0)
+
+    notify_email = models.BooleanField("이메일 알림 여부", default=True)
+    notify_telegram = models.BooleanField("텔레그램 알림 여부", default=False)
+
+    version = models.PositiveIntegerField("설정 버전", default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "alert_rules"
+        verbose_name = "알림 매칭 규칙"
+        verbose_name_plural = "알림 매칭 규칙 목록"
+        indexes = [
+            models.Index(
+                fields=["is_active", "frequency"], name="alert_rule_active_freq_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"알림 규칙 #{self.alert_id}"
+
+
+class AlertBatchCheckpoint(TimeStampedModel):
+    """
+    run_alert_batch 진행 위치 (frequency + shard 단위)
+    finished_at이 비어 있으면 중단된 실행
+    → 다음 실행이 last_alert_id 다음부터 이어서 처리
+    """
+
+    frequency = models.CharField("알림 빈도", max_length=20, blank=True, default="")
+    shard_index = models.PositiveIntegerField("샤드 번호", default=0)
+    shard_count = models.PositiveIntegerField("샤드 수", default=1)
+
+    last_alert_id = models.BigIntegerField("마지막 처리 알림 ID", default=0)
+    processed = models.IntegerField("처리한 알림 수", default=0)
+    started_at = models.DateTimeField("실행 시작 시각")
+    finished_at = models.DateTimeField("실행 종료 시각", null=True, blank=True)
+
+    class Meta:
+        db_table = "alert_batch_checkpoints"
+        verbose_name = "알림 배치 체크포인트"
+        verbose_name_plural = "알림 배치 체크포인트 목록"
+        constraints = [
+            # (알림, 매물) 발송 이력 NOT EXISTS 조회도
+            # 이 유니크 인덱스의 앞 두 컬럼을 사용
+            models.UniqueConstraint(
+                fields=["frequency", "shard_index", "shard_count"],
+                name="uniq_alert_batch_checkpoint_shard",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.frequency or 'all'} {self.shard_index}/{self.shard_count}"
+
+
 class NotificationLog(TimeStampedModel):
     class Channel(models.TextChoices):
         EMAIL = "email", "이메일"
@@ -65,6 +176,7 @@ class NotificationLog(TimeStampedModel):
 
     class Status(models.TextChoices):
         PENDING = "pending", "발송 대기"
+        SENDING = "sending", "발송 중"
         SUCCESS = "success", "발송 성공"
         FAILED = "failed", "발송 실패"
 
@@ -100,12 +212,30 @@ class NotificationLog(TimeStampedModel):
     )
 
     sent_at = models.DateTimeField("실제 발송 시각", null=True, blank=True)
+    # SENDING 상태의 점유 만료 시각 (지나면 다른 워커가 다시 가져감)
+    claimed_until = models.DateTimeField("발송 점유 만료 시각", null=True, blank=True)
 
     class Meta:
         db_table = "notification_logs"
         verbose_name = "알림 발송 로그"
         verbose_name_plural = "알림 발송 로그 목록"
         ordering = ["-created_at"]
+        constraints = [
+            # (알림, 매물) 발송 이력 NOT EXISTS 조회도
+            # 이 유니크 인덱스의 앞 두 컬럼을 사용
+            models.UniqueConstraint(
+                fields=["alert", "auction_item", "channel"],
+                name="uniq_notification_alert_item_channel",
+            ),
+        ]
+        indexes = [
+            # send_pending_notifications의 발송 대상 점유(claim) 조회용
+            models.Index(
+                fields=["status", "created_at"],
+                condition=models.Q(status__in=["pending", "sending"]),
+                name="notif_log_dispatch_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email}-[{self.channel}] : {self.status}"
@@ -40,10 +40,11 @@ class AlertPreferenceSerializer(serializers.ModelSerializer):
             "notify_telegram",
             "frequency",
             "is_active",
+            "match_count",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "match_count", "created_at", "updated_at"]
 
     def create(self, validated_data):
         request = self.context.get("request")
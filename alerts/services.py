@@ -1,42 +1,98 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import Iterable, List
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from django.conf import settings
-from django.core.mail import send_mail
-from django.db import transaction
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Exists, F, OuterRef, Q, QuerySet
+from django.db.models.functions import Greatest, Mod
 from django.utils import timezone
 
-from alerts.models import AlertPreference, NotificationLog
-from auctions.models import AuctionItem
-
-
-def find_matching_items_for_alert(alert: AlertPreference) -> Iterable[AuctionItem]:
+from alerts.mailer import build_email_message, send_email_messages
+from alerts.matching import (
+    ITEMS_GENERATION_KEY,
+    get_alert_index,
+)
+from alerts.models import (
+    AlertBatchCheckpoint,
+    AlertPreference,
+    AlertRule,
+    NotificationLog,
+)
+from alerts.telegram import TelegramMessage, send_telegram_messages_async
+from auctions.events import ITEM_EVENT_BATCH_SIZE, consume_item_events
+from auctions.models import AuctionItem, AuctionItemEvent
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_LOG_CHANNELS = [
+    (NotificationLog.Channel.EMAIL, "notify_email", "이메일 알림 대기"),
+    (NotificationLog.Channel.TELEGRAM, "notify_telegram", "텔레그램 알림 대기"),
+]
+NOTIFICATION_LOG_BULK_SIZE = 1000
+
+ALERT_PREVIEW_KEY = "alerts:preview:{}"
+ALERT_PREVIEW_LIMIT = 50
+ALERT_PREVIEW_TIMEOUT = 60 * 60 * 24
+
+# run_alert_batch에서 한 번에 평가/체크포인트하는 알림 수
+ALERT_BATCH_CHUNK_SIZE = 500
+
+# 매물 변경 이벤트(AuctionItemEvent) 소비자 이름
+ALERT_EVENT_CONSUMER = "alerts"
+
+# 증분 평가 시 이전 평가 시각보다 이만큼 앞부터 다시 조회
+ALERT_WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# 이미 발송됐거나 발송 예정(대기/발송 중)인 로그 상태
+# → 같은 매물을 다시 대기열에 넣지 않음
+# (FAILED만 재매칭 대상)
+NOTIFIED_STATUSES = (
+    NotificationLog.Status.PENDING,
+    NotificationLog.Status.SENDING,
+    NotificationLog.Status.SUCCESS,
+)
+
+# 매칭 수(match_count)/미리보기에서 빼는 로그 상태
+# → 발송 성공한 매물만 제외 (대기/발송 중은 포함)
+SENT_STATUSES = (NotificationLog.Status.SUCCESS,)
+
+# 모아서 보내는 알림 빈도
+DIGEST_FREQUENCIES = (
+    AlertPreference.Frequency.DAILY,
+    AlertPreference.Frequency.WEEKLY,
+)
+
+
+def _matching_items_queryset(alert: AlertPreference) -> QuerySet[AuctionItem]:
     """
-    - 지역
-    - 카테고리(대/중/소)
-    - 가격 범위
-    - 최소 유찰 횟수
-    - 경매일(오늘 이후)
-    - 이미 알림 보낸 매물은 제외
+    알림 조건(지역/카테고리/가격/유찰/경매일)만 적용한 매물 쿼리셋
+    - 발송 이력 제외는 호출하는 쪽에서 처리
     """
     qs = AuctionItem.objects.all()
 
     # 경매일
     qs = qs.filter(auction_date__gte=date.today())
 
-    # 지역
-    if alert.region:
-        qs = qs.filter(location__icontains=alert.region)
+    # 지역 (CompiledAlertRule / alert_rules와 같이 양끝 공백 제거)
+    region = (alert.region or "").strip()
+    if region:
+        qs = qs.filter(location__icontains=region)
 
     # 카테고리 필터
-    if alert.large_category:
-        qs = qs.filter(large=alert.large_category)
-    if alert.mid_category:
-        qs = qs.filter(middle=alert.mid_category)
-    if alert.small_categories.exists():
-        qs = qs.filter(small__in=alert.small_categories.all())
+    if alert.large_category_id:
+        qs = qs.filter(large_id=alert.large_category_id)
+    if alert.mid_category_id:
+        qs = qs.filter(middle_id=alert.mid_category_id)
+    # prefetch_related("small_categories")가 되어 있으면 추가 쿼리 없음
+    small_ids = [c.id for c in alert.small_categories.all()]
+    if small_ids:
+        qs = qs.filter(small_id__in=small_ids)
 
     # 가격 범위
     if alert.min_price is not None:
@@ -48,15 +104,49 @@ def find_matching_items_for_alert(alert: AlertPreference) -> Iterable[AuctionIte
     if alert.min_failures:
         qs = qs.filter(num_failures__gte=alert.min_failures)
 
-    # 이미 이 알림 + 유저 기준으로 성공적으로 보낸 매물은 제외
-    already_notified_ids = NotificationLog.objects.filter(
-        user=alert.user,
-        alert=alert,
-        status=NotificationLog.Status.SUCCESS,
-    ).values_list("auction_item_id", flat=True)
+    return qs
 
-    if already_notified_ids:
-        qs = qs.exclude(id__in=list(already_notified_ids))
+
+def alert_filter_signature(alert: AlertPreference) -> Tuple:
+    """
+    같은 매물 집합을 돌려주는 알림끼리 같은 값이 나오도록 정규화한 필터 키
+    - 지역은 icontains 기준이므로 공백 제거 + 소문자로 통일
+    - 유찰 0/None은 조건 없음으로 통일
+    """
+    return (
+        (alert.region or "").strip().lower(),
+        alert.large_category_id,
+        alert.mid_category_id,
+        tuple(sorted(c.id for c in alert.small_categories.all())),
+        alert.min_price,
+        alert.max_price,
+        alert.min_failures or 0,
+    )
+
+
+def find_matching_items_for_alert(
+    alert: AlertPreference, exclude_statuses: Iterable[str] = NOTIFIED_STATUSES
+) -> Iterable[AuctionItem]:
+    """
+    - 지역
+    - 카테고리(대/중/소)
+    - 가격 범위
+    - 최소 유찰 횟수
+    - 경매일(오늘 이후)
+    - 이미 알림 보냈거나 발송 대기/발송 중인 매물은 제외 (exclude_statuses)
+    """
+    qs = _matching_items_queryset(alert)
+
+    # id 목록을 가져와 NOT IN으로 넘기지 않고 NOT EXISTS 상관 서브쿼리로 처리
+    qs = qs.filter(
+        ~Exists(
+            NotificationLog.objects.filter(
+                alert=alert,
+                auction_item=OuterRef("pk"),
+                status__in=list(exclude_statuses),
+            )
+        )
+    )
 
     return qs
 
@@ -70,323 +160,1111 @@ def _build_email_subject(alert: AlertPreference, count: int) -> str:
     return base
 
 
-def _build_email_body(alert: AlertPreference, items: Iterable[AuctionItem]) -> str:
-    lines = []
+def _user_label(user) -> str:
     # user.name 없으면 username/email로 바꿔도 됨
-    user_label = (
-        getattr(alert.user, "name", None)
-        or getattr(alert.user, "username", None)
-        or alert.user.email
+    return (
+        getattr(user, "name", None)
+        or getattr(user, "username", None)
+        or user.email
         or "사용자"
     )
+
+
+def _format_item_block(item: AuctionItem) -> str:
+    min_price = item.min_bid_price
+    min_price_str = f"{min_price:,}원" if min_price else "-"
+
+    ai_price_str = (
+        f"{item.ai_predicted_price:,}원" if item.ai_predicted_price else "분석중"
+    )
+    ai_comment = item.ai_analysis or "분석 내용 없음"
+
+    return (
+        f"- [법원경매] {item.title}\n"
+        f"  위치: {item.location}\n"
+        f"  최저 입찰가: {min_price_str}\n"
+        f"  ★ AI 예상가: {ai_price_str}\n"
+        f"  ★ 분석: {ai_comment}\n"
+        f"  입찰일: {item.auction_date}\n"
+        f"  링크: {item.detail_url or '상세 링크 없음'}\n"
+    )
+
+
+def _format_telegram_item(item: AuctionItem) -> str:
+    min_price = item.min_bid_price
+    min_price_str = f"{min_price:,}원" if min_price else "-"
+    return (
+        f"• {item.title}\n"
+        f"  {item.location}\n"
+        f"  최저가 {min_price_str} / 입찰일 {item.auction_date}\n"
+        f"  {item.detail_url or '상세 링크 없음'}"
+    )
+
+
+#  매물별 메시지 조각 캐시
+#  - 같은 매물이 여러 알림/유저에 걸려도 본문 조각은 한 번만 렌더링
+#  - 키에 updated_at을 넣어 매물이 수정되면 자연히 새 키를 사용
+
+FRAGMENT_EMAIL = "email"
+FRAGMENT_TELEGRAM = "telegram"
+ITEM_FRAGMENT_KEY = "alerts:fragment:{}:{}:{}"  # 종류, 매물 id, updated_at
+ITEM_FRAGMENT_TIMEOUT = 60 * 60 * 24 * 7
+
+_FRAGMENT_RENDERERS = {
+    FRAGMENT_EMAIL: _format_item_block,
+    FRAGMENT_TELEGRAM: _format_telegram_item,
+}
+
+# {(종류, 매물 id): 렌더링된 조각}
+ItemFragments = Dict[Tuple[str, int], str]
+
+
+def _item_fragment_key(kind: str, item: AuctionItem) -> str:
+    stamp = int(item.updated_at.timestamp() * 1_000_000) if item.updated_at else 0
+    return ITEM_FRAGMENT_KEY.format(kind, item.pk, stamp)
+
+
+def load_item_fragments(
+    items: Iterable[AuctionItem], kinds: Iterable[str] = tuple(_FRAGMENT_RENDERERS)
+) -> ItemFragments:
+    """
+    매물 목록의 메시지 조각을 캐시에서 한 번에 읽고(get_many),
+    없는 것만 렌더링해 저장(set_many)
+    """
+    distinct = {item.pk: item for item in items if item is not None}
+    keys = {
+        (kind, pk): _item_fragment_key(kind, item)
+        for pk, item in distinct.items()
+        for kind in kinds
+    }
+    if not keys:
+        return {}
+
+    try:
+        cached = cache.get_many(list(keys.values()))
+    except Exception:
+        cached = {}
+
+    fragments: ItemFragments = {}
+    missing: Dict[str, str] = {}
+    for (kind, pk), key in keys.items():
+        text = cached.get(key)
+        if text is None:
+            text = _FRAGMENT_RENDERERS[kind](distinct[pk])
+            missing[key] = text
+        fragments[(kind, pk)] = text
+
+    if missing:
+        try:
+            cache.set_many(missing, ITEM_FRAGMENT_TIMEOUT)
+        except Exception:
+            # 캐시 장애 시에도 발송은 계속
+            pass
+    return fragments
+
+
+def _item_fragment(
+    kind: str, item: AuctionItem, fragments: Optional[ItemFragments]
+) -> str:
+    text = fragments.get((kind, item.pk)) if fragments else None
+    return text if text is not None else _FRAGMENT_RENDERERS[kind](item)
+
+
+def _build_email_body(
+    alert: AlertPreference,
+    items: Iterable[AuctionItem],
+    fragments: Optional[ItemFragments] = None,
+) -> str:
+    lines = []
+    user_label = _user_label(alert.user)
     lines.append(f"{user_label}님, 설정하신 조건에 맞는 신규 매물이 발견되었습니다.\n")
 
     for item in items:
-        min_price = item.min_bid_price
-        min_price_str = f"{min_price:,}원" if min_price else "-"
-
-        ai_price_str = (
-            f"{item.ai_predicted_price:,}원" if item.ai_predicted_price else "분석중"
-        )
-        ai_comment = item.ai_analysis or "분석 내용 없음"
-
-        line = (
-            f"- [법원경매] {item.title}\n"
-            f"  위치: {item.location}\n"
-            f"  최저 입찰가: {min_price_str}\n"
-            f"  ★ AI 예상가: {ai_price_str}\n"
-            f"  ★ 분석: {ai_comment}\n"
-            f"  입찰일: {item.auction_date}\n"
-            f"  링크: {item.detail_url or '상세 링크 없음'}\n"
-        )
-        lines.append(line)
+        lines.append(_item_fragment(FRAGMENT_EMAIL, item, fragments))
 
     lines.append("\nAucRadar 알림 설정에서 조건을 변경하거나 해제할 수 있습니다.")
     return "\n".join(lines)
 
 
-def _send_email_for_alert(alert: AlertPreference, items: List[AuctionItem]) -> bool:
-    if not alert.user.email:
-        return False
+def _build_alert_email(
+    alert: AlertPreference,
+    items: List[AuctionItem],
+    fragments: Optional[ItemFragments] = None,
+):
+    return build_email_message(
+        alert.user,
+        _build_email_subject(alert, len(items)),
+        _build_email_body(alert, items, fragments),
+    )
+
+
+def _build_telegram_message(
+    user,
+    title: str,
+    items: List[AuctionItem],
+    fragments: Optional[ItemFragments] = None,
+) -> Optional[TelegramMessage]:
+    profile = getattr(user, "telegram_profile", None) if user else None
+    if not profile or not profile.is_active or not profile.chat_id:
+        return None
+
+    lines = [title]
+    lines.extend(_item_fragment(FRAGMENT_TELEGRAM, item, fragments) for item in items)
+    return TelegramMessage(profile.chat_id, "\n\n".join(lines))
+
+
+def _build_alert_telegram(
+    alert: AlertPreference,
+    items: List[AuctionItem],
+    fragments: Optional[ItemFragments] = None,
+):
+    return _build_telegram_message(
+        alert.user, _build_email_subject(alert, len(items)), items, fragments
+    )
+
+
+async def _dispatch_async(email_messages, telegram_messages):
+    return await asyncio.gather(
+        asyncio.to_thread(send_email_messages, email_messages),
+        send_telegram_messages_async(telegram_messages),
+    )
 
-    subject = _build_email_subject(alert, len(items))
-    body = _build_email_body(alert, items)
 
+def _dispatch_messages(
+    email_messages: List, telegram_messages: List
+) -> Tuple[List[bool], List[bool]]:
+    """
+    이메일 배치(스레드)와 텔레그램 비동기 발송을 동시에 진행
+    반환: (이메일 성공 여부 목록, 텔레그램 성공 여부 목록)
+    """
+    if not email_messages and not telegram_messages:
+        return [], []
+    email_results, telegram_results = asyncio.run(
+        _dispatch_async(email_messages, telegram_messages)
+    )
+    return email_results, telegram_results
+
+
+def get_cached_alert_preview(alert: AlertPreference) -> Tuple[Optional[list], list]:
+    """
+    미리보기 캐시 조회 (캐시 값과 매물 세대 번호를 한 번에 읽음)
+    - stamp = [알림 설정 버전, 매물 세대, 오늘 날짜]가 같을 때만 캐시 사용
+    반환: (캐시된 데이터 또는 None, 현재 stamp)
+    """
+    key = ALERT_PREVIEW_KEY.format(alert.id)
+    try:
+        values = cache.get_many([key, ITEMS_GENERATION_KEY])
+    except Exception:
+        # 캐시 장애 시 캐시 없이 매번 조회
+        logger.exception("알림 미리보기 캐시 조회 실패 (alert_id=%s)", alert.id)
+        values = {}
+    stamp = [
+        alert.version,
+        values.get(ITEMS_GENERATION_KEY, 0),
+        date.today().isoformat(),
+    ]
+
+    cached = values.get(key)
+    if cached and cached.get("stamp") == stamp:
+        return cached["data"], stamp
+    return None, stamp
+
+
+def set_cached_alert_preview(alert: AlertPreference, stamp: list, data: list) -> None:
     try:
-        send_mail(
-            subject,
-            body,
-            getattr(settings, "DEFAULT_FROM_EMAIL", None),
-            [alert.user.email],
+        cache.set(
+            ALERT_PREVIEW_KEY.format(alert.id),
+            {"stamp": stamp, "data": data},
+            ALERT_PREVIEW_TIMEOUT,
         )
-        return True
     except Exception:
-        return False
+        logger.exception("알림 미리보기 캐시 저장 실패 (alert_id=%s)", alert.id)
 
 
-def _send_telegram_for_alert(alert: AlertPreference, items: List[AuctionItem]) -> bool:
-    try:
-        profile = getattr(alert.user, "telegram_profile", None)
-        if not profile or not getattr(profile, "is_active", False):
-            return False
+def invalidate_alert_previews(alert_ids: Iterable[Optional[int]]) -> None:
+    # 발송 성공/새 매칭으로 미리보기 목록이 바뀐 알림의 캐시 삭제
+    keys = [
+        ALERT_PREVIEW_KEY.format(alert_id) for alert_id in set(alert_ids) if alert_id
+    ]
+    if keys:
+        try:
+            cache.delete_many(keys)
+        except Exception:
+            # 발송/매칭 기록은 이미 끝났으므로 실패로 보지 않음
+            # (미리보기는 stamp 만료 시 갱신)
+            logger.exception("알림 미리보기 캐시 삭제 실패")
 
-        # TODO: 텔레그램 Bot API 호출 구현
-        return True
-    except Exception:
-        return False
+
+def adjust_alert_match_counts(deltas: Dict[int, int]) -> None:
+    """
+    {alert_id: 증감}을 match_count에 반영
+    (같은 증감값끼리 UPDATE 1번, 0 미만으로는 내려가지 않음)
+    - 정확한 값은 reconcile_alert_match_counts()가 주기적으로 다시 맞춤
+    """
+    by_delta: Dict[int, List[int]] = defaultdict(list)
+    for alert_id, delta in deltas.items():
+        if alert_id and delta:
+            by_delta[delta].append(alert_id)
+    for delta, ids in by_delta.items():
+        AlertPreference.objects.filter(id__in=ids).update(
+            match_count=Greatest(F("match_count") + delta, 0)
+        )
 
 
-def send_notifications_for_alert(alert: AlertPreference) -> int:
+# 발송 성공 기록 + match_count 감소를 한 문장으로 처리
+# - 같은 (알림, 매물)의 다른 채널 로그가 이미 발송 성공했으면 감소하지 않음
+#   (채널별로 다른 배치에서 성공하거나 실패 로그가 재시도로 성공해도 한 번만 감소)
+# - NOT EXISTS는 문장 시작 시점 기준이므로 이번에 성공 처리하는 로그는 보이지 않음
+NOTIFICATION_SENT_SQL = """
+WITH sent AS (
+    UPDATE {logs} AS n
+    SET status = %(success)s,
+        sent_at = %(now)s,
+        error_message = NULL,
+        message_body = %(body)s,
+        claimed_until = NULL,
+        updated_at = %(now)s
+    WHERE n.id = ANY(%(ids)s)
+    RETURNING n.alert_id, n.auction_item_id
+),
+first_sent AS (
+    SELECT s.alert_id, count(DISTINCT s.auction_item_id) AS cnt
+    FROM sent s
+    WHERE s.alert_id IS NOT NULL
+      AND NOT EXISTS (
+          SELECT 1 FROM {logs} l
+          WHERE l.alert_id = s.alert_id
+            AND l.auction_item_id = s.auction_item_id
+            AND l.status = %(success)s
+            AND NOT (l.id = ANY(%(ids)s))
+      )
+    GROUP BY s.alert_id
+),
+counted AS (
+    UPDATE {alerts} AS p
+    SET match_count = GREATEST(p.match_count - f.cnt, 0)
+    FROM first_sent f
+    WHERE p.id = f.alert_id
+)
+SELECT DISTINCT alert_id FROM sent WHERE alert_id IS NOT NULL
+"""
+
+
+def _mark_notifications_sent(log_ids: List[int], message_body: str) -> None:
+    """
+    발송 성공한 로그 처리
+    - SUCCESS 기록 + 처음 발송된 (알림, 매물)만큼 match_count 감소
+      (NOTIFICATION_SENT_SQL)
+    - 해당 알림 미리보기 캐시 삭제 (발송된 매물은 미리보기에서 빠짐)
     """
-    알림 설정 하나에 대해:
-    - 매칭되는 매물 찾고
-    - 이메일 / 텔레그램 발송 시도
-    - NotificationLog 남기기
+    if not log_ids:
+        return
+    sql = NOTIFICATION_SENT_SQL.format(
+        logs=NotificationLog._meta.db_table,
+        alerts=AlertPreference._meta.db_table,
+    )
+    now = timezone.now()
+    params = {
+        "success": NotificationLog.Status.SUCCESS,
+        "now": now,
+        "body": message_body,
+        "ids": list(log_ids),
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        alert_ids = [row[0] for row in cursor.fetchall()]
+    invalidate_alert_previews(alert_ids)
+
+
+def reconcile_alert_match_counts(alert_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    match_count를 실제 매칭 쿼리 기준으로 다시 계산 (야간 배치 / 알림 설정 변경 시)
+    반환: 갱신한 알림 수
+    """
+    qs = AlertPreference.objects.prefetch_related("small_categories")
+    if alert_ids is not None:
+        qs = qs.filter(id__in=list(alert_ids))
+
+    now = timezone.now()
+    alerts = []
+    for alert in qs.order_by("id"):
+        # 매칭 수는 아직 발송 성공하지 않은 매물 기준 (대기 중인 매물 포함)
+        alert.match_count = (
+            find_matching_items_for_alert(alert, exclude_statuses=SENT_STATUSES).count()
+            if alert.is_active
+            else 0
+        )
+        alert.match_count_reconciled_at = now
+        alerts.append(alert)
+
+    AlertPreference.objects.bulk_update(
+        alerts,
+        ["match_count", "match_count_reconciled_at"],
+        batch_size=NOTIFICATION_LOG_BULK_SIZE,
+    )
+    return len(alerts)
+
 
-    반환값: 발송 시도한 매물 수
+def _notified_item_ids_by_alert(
+    alert_ids: List[int], items_qs: QuerySet[AuctionItem]
+) -> Dict[int, Set[int]]:
     """
-    if not alert.is_active:
-        return 0
+    여러 알림의 발송(대기/발송 중/성공) 이력을 쿼리 1번으로 조회
+    → {alert_id: {auction_item_id}}
+    - 매물은 id 목록 대신 서브쿼리로 넘김 (전체 재평가 시에도 IN 목록이 커지지 않음)
+    """
+    notified: Dict[int, Set[int]] = defaultdict(set)
+    rows = (
+        NotificationLog.objects.filter(
+            alert_id__in=alert_ids,
+            auction_item_id__in=items_qs.values("id"),
+            status__in=NOTIFIED_STATUSES,
+        )
+        .order_by()
+        .values_list("alert_id", "auction_item_id")
+    )
+    for alert_id, item_id in rows:
+        notified[alert_id].add(item_id)
+    return notified
 
-    items_qs = find_matching_items_for_alert(alert)
-    items = list(items_qs)
-    if not items:
-        return 0
 
-    now = timezone.now()
-    sent_count = 0
+def _evaluation_cutoff(alert: AlertPreference):
+    """
+    증분 평가 기준 시각 (None이면 전체 재평가)
+    - 한 번도 평가 안 했거나 평가 이후 설정이 바뀐 알림은 전체 재평가
+    - 평가 도중 커밋된 매물을 놓치지 않도록 ALERT_WATERMARK_OVERLAP만큼 겹쳐서 조회
+    """
+    if alert.last_evaluated_at is None or alert.evaluated_version != alert.version:
+        return None
+    return alert.last_evaluated_at - ALERT_WATERMARK_OVERLAP
 
-    for item in items:
-        # 이메일
-        if alert.notify_email:
-            success = _send_email_for_alert(alert, [item])
-            NotificationLog.objects.create(
-                user=alert.user,
-                alert=alert,
-                auction_item=item,
-                channel=NotificationLog.Channel.EMAIL,
-                status=(
-                    NotificationLog.Status.SUCCESS
-                    if success
-                    else NotificationLog.Status.FAILED
-                ),
-                message_title=item.title,
-                message_body="이메일 알림 발송(배치형)",
-                error_message=None if success else "이메일 발송 실패",
-                sent_at=now if success else None,
+
+def _mark_alerts_evaluated(alerts: List[AlertPreference], evaluated_at) -> None:
+    # 평가 도중 설정이 바뀐 알림(version 불일치)은 갱신하지 않음
+    # → 다음 배치에서 전체 재평가
+    by_version: Dict[int, List[int]] = defaultdict(list)
+    for alert in alerts:
+        by_version[alert.version].append(alert.id)
+    for version, ids in by_version.items():
+        AlertPreference.objects.filter(id__in=ids, version=version).update(
+            last_evaluated_at=evaluated_at,
+            evaluated_version=version,
+        )
+
+
+def _evaluate_alerts(alerts: List[AlertPreference], started_at) -> int:
+    """
+    알림 묶음을 (필터 조건(alert_filter_signature), 증분 기준 시각)별로 묶어 평가
+    - 매물 조회는 같은 조건 그룹당 1번
+    - 마지막 평가 이후 조건 필드가 바뀐 매물(changed_at)과 발송 실패 매물만 다시 매칭
+    - 발송 이력 제외는 그룹당 1번 조회 후 메모리에서 처리
+    - 여기서는 PENDING 로그만 저장하고,
+      발송은 send_pending_notifications()/요약 발송이 담당
+      (발송 전에 로그가 먼저 남으므로 중단 후 재개해도 같은 매물을 다시 보내지 않음)
+    반환: 처리한 알림 수
+    """
+    groups: Dict[Tuple, List[AlertPreference]] = defaultdict(list)
+    for alert in alerts:
+        groups[(alert_filter_signature(alert), _evaluation_cutoff(alert))].append(alert)
+
+    processed = 0
+    logs: List[NotificationLog] = []
+
+    for (_, cutoff), group in groups.items():
+        items_qs = _matching_items_queryset(group[0])
+        if cutoff is not None:
+            items_qs = items_qs.filter(
+                Q(changed_at__gt=cutoff)
+                | Exists(
+                    NotificationLog.objects.filter(
+                        alert_id__in=[alert.id for alert in group],
+                        auction_item=OuterRef("pk"),
+                        status=NotificationLog.Status.FAILED,
+                    )
+                )
             )
+        items = list(items_qs)
 
-        # 텔레그램
-        if alert.notify_telegram:
-            success = _send_telegram_for_alert(alert, [item])
-            NotificationLog.objects.create(
-                user=alert.user,
-                alert=alert,
-                auction_item=item,
-                channel=NotificationLog.Channel.TELEGRAM,
-                status=(
-                    NotificationLog.Status.SUCCESS
-                    if success
-                    else NotificationLog.Status.FAILED
-                ),
-                message_title=item.title,
-                message_body="텔레그램 알림 발송(배치형)",
-                error_message=None if success else "텔레그램 발송 실패",
-                sent_at=now if success else None,
+        notified: Dict[int, Set[int]] = {}
+        if items:
+            notified = _notified_item_ids_by_alert(
+                [alert.id for alert in group], items_qs
             )
 
-        sent_count += 1
+        for alert in group:
+            already = notified.get(alert.id, set())
+            for item in items:
+                if item.id not in already:
+                    logs.extend(_pending_logs(item, [alert]))
+            processed += 1
+
+    _enqueue_matches(logs)
+    _mark_alerts_evaluated(alerts, started_at)
+
+    return processed
+
+
+def _parse_shard(shard: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+    if shard is None:
+        return 0, 1
+    index, count = shard
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"잘못된 shard 값: {index}/{count}")
+    return index, count
+
+
+def _start_checkpoint(frequency: str | None, index: int, count: int):
+    """
+    (frequency, shard) 단위 체크포인트
+    - 이전 실행이 끝나지 않았으면 그 위치(last_alert_id)부터 이어서 진행
+    - 끝났으면 새 실행으로 초기화
+    """
+    checkpoint, _ = AlertBatchCheckpoint.objects.get_or_create(
+        frequency=frequency or "",
+        shard_index=index,
+        shard_count=count,
+        defaults={"started_at": timezone.now()},
+    )
+    if checkpoint.finished_at is not None:
+        checkpoint.started_at = timezone.now()
+        checkpoint.finished_at = None
+        checkpoint.last_alert_id = 0
+        checkpoint.processed = 0
+        checkpoint.save(
+            update_fields=[
+                "started_at",
+                "finished_at",
+                "last_alert_id",
+                "processed",
+                "updated_at",
+            ]
+        )
+    return checkpoint
 
-    return sent_count
 
+def run_alert_batch(
+    frequency: str | None = None, shard: Optional[Tuple[int, int]] = None
+) -> int:
+    """
+    활성 알림을 id 순서로 ALERT_BATCH_CHUNK_SIZE개씩 평가한다.
+    - shard=(i, N): user_id % N == i 인 유저의 알림만 처리 (여러 프로세스/호스트로 분할)
+    - 묶음마다 체크포인트를 남겨, 중단된 실행은 다음 실행 때 이어서 진행
+    - daily/weekly 알림은 PENDING으로 쌓고, 해당 frequency로 실행될 때 요약 발송
+    반환: 이번 실행에서 처리한 알림 수
+    """
+    index, count = _parse_shard(shard)
+    checkpoint = _start_checkpoint(frequency, index, count)
 
-def run_alert_batch(frequency: str | None = None) -> int:
     qs = AlertPreference.objects.filter(is_active=True)
     if frequency:
         qs = qs.filter(frequency=frequency)
+    if count > 1:
+        qs = qs.alias(shard=Mod("user_id", count)).filter(shard=index)
+    qs = (
+        qs.select_related("user__telegram_profile")
+        .prefetch_related("small_categories")
+        .order_by("id")
+    )
 
     processed = 0
-    for alert in qs.select_related("user"):
-        send_notifications_for_alert(alert)
-        processed += 1
+    while True:
+        alerts = list(
+            qs.filter(id__gt=checkpoint.last_alert_id)[:ALERT_BATCH_CHUNK_SIZE]
+        )
+        if not alerts:
+            break
 
-    return processed
+        # 재개된 실행도 워터마크는 최초 시작 시각 기준
+        chunk_processed = _evaluate_alerts(alerts, checkpoint.started_at)
+        processed += chunk_processed
 
+        checkpoint.last_alert_id = alerts[-1].id
+        checkpoint.processed += chunk_processed
+        checkpoint.save(update_fields=["last_alert_id", "processed", "updated_at"])
 
-def _alert_matches_item(alert: AlertPreference, item: AuctionItem) -> bool:
-    """
-    AlertPreference 1개가 AuctionItem 1개와 매칭되는지
-    """
-    if not alert.is_active:
-        return False
+        # 즉시 알림은 묶음마다 대기 로그를 발송 (점유 후 발송 → 결과 기록)
+        if frequency not in DIGEST_FREQUENCIES:
+            drain_pending_notifications()
 
-    # 경매일(기본: 오늘 이후)
-    if item.auction_date and item.auction_date < date.today():
-        return False
+    checkpoint.finished_at = timezone.now()
+    checkpoint.save(update_fields=["finished_at", "updated_at"])
 
-    # 지역
-    if alert.region:
-        if not item.location:
-            return False
-        if alert.region not in item.location:
-            if alert.region.lower() not in item.location.lower():
-                return False
-
-    # 카테고리
-    if alert.large_category and alert.large_category_id != getattr(
-        item, "large_id", None
-    ):
-        return False
-    if alert.mid_category and alert.mid_category_id != getattr(item, "middle_id", None):
-        return False
-
-    # 소분류: alert가 소분류를 지정했으면 item.small이 포함돼야 함
-    if alert.small_categories.exists():
-        if getattr(item, "small_id", None) is None:
-            return False
-        if not alert.small_categories.filter(id=item.small_id).exists():
-            return False
-
-    # 가격
-    if alert.min_price is not None:
-        if item.min_bid_price is None or item.min_bid_price < alert.min_price:
-            return False
-    if alert.max_price is not None:
-        if item.min_bid_price is None or item.min_bid_price > alert.max_price:
-            return False
-
-    # 유찰
-    if alert.min_failures:
-        if item.num_failures is None or item.num_failures < alert.min_failures:
-            return False
+    # daily/weekly 실행이면 대기 중인 매칭을 유저별 요약으로 발송
+    if frequency in DIGEST_FREQUENCIES:
+        send_digest_notifications(frequency, shard=(index, count))
 
-    return True
+    return processed
 
 
-@transaction.atomic
-def create_notification_logs_for_new_item(item: AuctionItem) -> int:
+def sync_alert_rules(alert_ids: Iterable[int]) -> None:
     """
-    크롤링 직후 item 1개 기준으로 매칭되는 AlertPreference들을 찾아
-    NotificationLog를 'PENDING'으로 생성한다.
-    - 실제 발송은 send_pending_notifications()가 담당.
-    반환: 생성된 로그 개수
+    AlertPreference → AlertRule(alert_rules) 동기화 (없으면 생성, 있으면 덮어씀)
     """
-    # 여기서 PENDING enum이 없다면 모델에 맞춰 수정:
-    # - 예: NotificationLog.Status.QUEUED / NotificationLog.Status.PENDING 등
-    pending_status = NotificationLog.Status.PENDING
+    alerts = AlertPreference.objects.filter(pk__in=list(alert_ids)).prefetch_related(
+        "small_categories"
+    )
+    rules = [
+        AlertRule(
+            alert_id=alert.id,
+            user_id=alert.user_id,
+            is_active=alert.is_active,
+            frequency=alert.frequency,
+            region=(alert.region or "").strip().lower(),
+            large_id=alert.large_category_id,
+            mid_id=alert.mid_category_id,
+            small_ids=sorted(c.id for c in alert.small_categories.all()),
+            min_price=alert.min_price,
+            max_price=alert.max_price,
+            min_failures=alert.min_failures or 0,
+            notify_email=alert.notify_email,
+            notify_telegram=alert.notify_telegram,
+            version=alert.version,
+            updated_at=timezone.now(),
+        )
+        for alert in alerts
+    ]
+    if rules:
+        AlertRule.objects.bulk_create(
+            rules,
+            update_conflicts=True,
+            unique_fields=["alert"],
+            update_fields=[
+                "user",
+                "is_active",
+                "frequency",
+                "region",
+                "large_id",
+                "mid_id",
+                "small_ids",
+                "min_price",
+                "max_price",
+                "min_failures",
+                "notify_email",
+                "notify_telegram",
+                "version",
+                "updated_at",
+            ],
+        )
 
-    alerts = (
-        AlertPreference.objects.filter(is_active=True)
-        .select_related("user", "large_category", "mid_category")
-        .prefetch_related("small_categories")
-        .order_by("id")
+
+# alert_rules × auction_items 조인 결과를 notification_logs에 한 문장으로 적재
+# 파이썬 엔진(CompiledAlertRule / _matching_items_queryset)과 같은 조건:
+# - 지역: 양끝 공백 제거 + 소문자 부분 일치
+#   (alert_rules.region은 정규화된 값으로 저장됨)
+# - 경매일: 오늘 이후만 (경매일 없는 매물 제외)
+# - 가격/유찰: 값이 없는 매물은 조건이 있으면 제외 (NULL 비교 = 불일치)
+# - 발송 대기/발송 중/성공 로그가 있으면 제외, 발송 실패(FAILED) 로그는 다시 PENDING으로
+# 같은 문장에서 새로 추가된 (알림, 매물)만큼 match_count를 올리고
+# 평가 시각(워터마크)도 갱신 (평가 도중 설정이 바뀐 알림은 버전이 달라
+# 워터마크를 건드리지 않음 → 다음 배치에서 전체 재평가)
+# 파이썬 엔진과 다른 점: 증분 평가 없이 매번 전체 재평가,
+# 샤드 미지원 (run_alerts에서 거부)
+ALERT_MATCH_INSERT_SQL = """
+WITH matched AS (
+    INSERT INTO {logs} AS n (
+        created_at, updated_at, user_id, alert_id, auction_item_id, channel,
+        status, message_title, message_body
     )
+    SELECT
+        now(), now(), r.user_id, r.alert_id, i.id, c.channel,
+        %(pending)s, LEFT(i.title, 200), c.body
+    FROM {rules} r
+    JOIN {items} i
+      ON i.auction_date >= CURRENT_DATE
+     AND (r.region = '' OR strpos(lower(i.location), r.region) > 0)
+     AND (r.large_id IS NULL OR i.large_id = r.large_id)
+     AND (r.mid_id IS NULL OR i.middle_id = r.mid_id)
+     AND (cardinality(r.small_ids) = 0 OR i.small_id = ANY(r.small_ids))
+     AND (r.min_price IS NULL OR i.min_bid_price >= r.min_price)
+     AND (r.max_price IS NULL OR i.min_bid_price <= r.max_price)
+     AND (r.min_failures = 0 OR i.num_failures >= r.min_failures)
+    CROSS JOIN LATERAL (
+        VALUES
+            (%(email)s, r.notify_email, %(email_body)s),
+            (%(telegram)s, r.notify_telegram, %(telegram_body)s)
+    ) AS c(channel, enabled, body)
+    WHERE r.is_active
+      AND c.enabled
+      AND (%(frequency)s::varchar IS NULL OR r.frequency = %(frequency)s::varchar)
+      AND NOT EXISTS (
+          SELECT 1 FROM {logs} l
+          WHERE l.alert_id = r.alert_id
+            AND l.auction_item_id = i.id
+            AND l.channel = c.channel
+            AND l.status = ANY(%(notified)s)
+      )
+    ON CONFLICT (alert_id, auction_item_id, channel) DO UPDATE
+    SET status = EXCLUDED.status,
+        message_body = EXCLUDED.message_body,
+        error_message = NULL,
+        claimed_until = NULL,
+        updated_at = EXCLUDED.updated_at
+    WHERE n.status = %(failed)s
+    RETURNING n.alert_id, n.auction_item_id, (n.xmax = 0) AS inserted
+),
+new_matches AS (
+    SELECT alert_id, count(DISTINCT auction_item_id) AS cnt
+    FROM matched
+    WHERE inserted
+    GROUP BY alert_id
+),
+evaluated AS (
+    UPDATE {alerts} AS p
+    SET match_count = p.match_count + COALESCE(m.cnt, 0),
+        last_evaluated_at = CASE
+            WHEN p.version = r.version THEN %(started_at)s ELSE p.last_evaluated_at
+        END,
+        evaluated_version = CASE
+            WHEN p.version = r.version THEN r.version ELSE p.evaluated_version
+        END
+    FROM {rules} r
+    LEFT JOIN new_matches m ON m.alert_id = r.alert_id
+    WHERE p.id = r.alert_id
+      AND r.is_active
+      AND (%(frequency)s::varchar IS NULL OR r.frequency = %(frequency)s::varchar)
+)
+SELECT (SELECT count(*) FROM matched), ARRAY(SELECT alert_id FROM new_matches)
+"""
+
+
+def create_notification_logs_sql(frequency: str | None = None) -> int:
+    """
+    활성 알림 전체의 매칭 + PENDING 로그 생성을 PostgreSQL 문장 1개로 처리
+    (match_count / 워터마크 갱신 포함, 발송 실패 로그는 다시 대기열로)
+    반환: 대기열에 들어간 로그 수
+    """
+    sql = ALERT_MATCH_INSERT_SQL.format(
+        logs=NotificationLog._meta.db_table,
+        rules=AlertRule._meta.db_table,
+        items=AuctionItem._meta.db_table,
+        alerts=AlertPreference._meta.db_table,
+    )
+    params = {
+        "pending": NotificationLog.Status.PENDING,
+        "failed": NotificationLog.Status.FAILED,
+        "notified": list(NOTIFIED_STATUSES),
+        "email": NotificationLog.Channel.EMAIL,
+        "email_body": "이메일 알림 대기",
+        "telegram": NotificationLog.Channel.TELEGRAM,
+        "telegram_body": "텔레그램 알림 대기",
+        "frequency": frequency,
+        "started_at": timezone.now(),
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        queued, new_alert_ids = cursor.fetchone()
+    invalidate_alert_previews(new_alert_ids)
+    return queued
+
+
+def run_alert_batch_sql(frequency: str | None = None) -> int:
+    """
+    run_alert_batch의 SQL 엔진 버전
+    - 매칭/로그 생성/match_count/워터마크는 DB에서 한 문장으로 처리 (파이썬 루프 없음)
+    - 즉시 알림은 대기 로그를 모두 발송, daily/weekly는 요약 발송
+      (발송 후 처리(_mark_notifications_sent)는 두 엔진이 같은 발송 함수를 사용)
+    - 샤드는 지원하지 않음 (run_alerts에서 --engine sql --shard 조합 거부)
+    반환: 대기열에 들어간 로그 수
+    """
+    created = create_notification_logs_sql(frequency)
 
-    created = 0
+    if frequency in DIGEST_FREQUENCIES:
+        send_digest_notifications(frequency)
+    else:
+        drain_pending_notifications()
 
-    for alert in alerts:
-        if not _alert_matches_item(alert, item):
-            continue
+    return created
 
-        # 이메일 로그 (중복 방지: alert+item+channel)
-        if alert.notify_email:
-            if not NotificationLog.objects.filter(
-                alert=alert,
-                auction_item=item,
-                channel=NotificationLog.Channel.EMAIL,
-            ).exists():
-                NotificationLog.objects.create(
-                    user=alert.user,
-                    alert=alert,
-                    auction_item=item,
-                    channel=NotificationLog.Channel.EMAIL,
-                    status=pending_status,
-                    message_title=item.title,
-                    message_body="이메일 알림 대기",
-                    error_message=None,
-                    sent_at=None,
-                )
-                created += 1
 
-        # 텔레그램 로그
-        if alert.notify_telegram:
-            if not NotificationLog.objects.filter(
-                alert=alert,
-                auction_item=item,
-                channel=NotificationLog.Channel.TELEGRAM,
-            ).exists():
-                NotificationLog.objects.create(
-                    user=alert.user,
-                    alert=alert,
+def _pending_logs(item: AuctionItem, alerts: Iterable) -> List[NotificationLog]:
+    logs = []
+    for alert in alerts:
+        for channel, flag, body in NOTIFICATION_LOG_CHANNELS:
+            if not getattr(alert, flag):
+                continue
+            logs.append(
+                NotificationLog(
+                    user_id=alert.user_id,
+                    alert_id=alert.id,
                     auction_item=item,
-                    channel=NotificationLog.Channel.TELEGRAM,
-                    status=pending_status,
+                    channel=channel,
+                    status=NotificationLog.Status.PENDING,
                     message_title=item.title,
-                    message_body="텔레그램 알림 대기",
+                    message_body=body,
                     error_message=None,
                     sent_at=None,
                 )
-                created += 1
+            )
+    return logs
+
+
+# PENDING 로그 적재: 새 (알림, 매물, 채널)은 추가하고,
+# 발송 실패(FAILED) 로그만 다시 대기열로
+# - PENDING/SENDING/SUCCESS 로그는 건드리지 않음
+#   (디스패처가 점유한 로그를 덮어쓰지 않음)
+# - xmax = 0 이면 이번에 새로 추가된 행
+NOTIFICATION_ENQUEUE_SQL = """
+INSERT INTO {logs} AS n (
+    created_at, updated_at, user_id, alert_id, auction_item_id, channel,
+    status, message_title, message_body
+)
+VALUES {values}
+ON CONFLICT (alert_id, auction_item_id, channel) DO UPDATE
+SET status = EXCLUDED.status,
+    message_body = EXCLUDED.message_body,
+    error_message = NULL,
+    claimed_until = NULL,
+    updated_at = EXCLUDED.updated_at
+WHERE n.status = %s
+RETURNING n.id, n.alert_id, n.auction_item_id, (n.xmax = 0) AS inserted
+"""
+
+
+def _enqueue_notification_logs(
+    logs: List[NotificationLog],
+) -> List[Tuple[int, int, int, bool]]:
+    """
+    발송 전에 PENDING 로그부터 저장 (실제 발송은 claim 후 _send_claimed_notifications)
+    반환: 대기열에 들어간 로그의 (id, alert_id, auction_item_id, 신규 추가 여부)
+    """
+    now = timezone.now()
+    rows: List[Tuple[int, int, int, bool]] = []
+    for i in range(0, len(logs), NOTIFICATION_LOG_BULK_SIZE):
+        chunk = logs[i : i + NOTIFICATION_LOG_BULK_SIZE]
+        params: List = []
+        for log in chunk:
+            params.extend(
+                [
+                    now,
+                    now,
+                    log.user_id,
+                    log.alert_id,
+                    log.auction_item_id,
+                    log.channel,
+                    NotificationLog.Status.PENDING,
+                    (log.message_title or "")[:200],
+                    log.message_body,
+                ]
+            )
+        params.append(NotificationLog.Status.FAILED)
+        sql = NOTIFICATION_ENQUEUE_SQL.format(
+            logs=NotificationLog._meta.db_table,
+            values=", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s)"] * len(chunk)),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows.extend(cursor.fetchall())
+    return rows
 
-    return created
+
+@transaction.atomic
+def _enqueue_matches(logs: List[NotificationLog]) -> List[Tuple[int, int, int, bool]]:
+    """
+    PENDING 로그 적재 + 이번에 새로 추가된 (알림, 매물)만큼 match_count 증가
+    (이미 로그가 있던 조합, 다시 대기열에 들어간 실패 로그는 세지 않음)
+    - match_count가 바뀐 알림은 미리보기 캐시도 삭제 (매칭 수와 미리보기 목록을 맞춤)
+    """
+    rows = _enqueue_notification_logs(logs)
+    deltas: Dict[int, int] = defaultdict(int)
+    for alert_id, _ in {(row[1], row[2]) for row in rows if row[3]}:
+        deltas[alert_id] += 1
+    adjust_alert_match_counts(deltas)
+    invalidate_alert_previews(deltas)
+    return rows
+
+
+def handle_item_events(events: List[AuctionItemEvent]) -> int:
+    """
+    매물 변경 이벤트 묶음 → 알림 로그 생성
+    - 신규 등록: 전체 알림 후보와 매칭
+    - 가격/유찰 횟수 변경: 이전 값 → 새 값 사이에 기준값이 있는 알림만 매칭
+      (이번 변경으로 새로 조건을 만족하게 된 알림만 평가)
+    반환: 대기열에 들어간 로그 개수
+    """
+    index = get_alert_index()
+    items: Dict[int, AuctionItem] = {}
+    matched: Dict[int, Dict[int, object]] = defaultdict(dict)
+
+    for event in events:
+        item = event.auction_item
+        items[item.id] = item
+
+        if event.event_type == AuctionItemEvent.Type.CREATED:
+            alerts = index.candidates(item)
+        elif event.event_type in (
+            AuctionItemEvent.Type.PRICE_CHANGED,
+            AuctionItemEvent.Type.FAILURES_CHANGED,
+        ):
+            alerts = []
+            for field, (old, new) in event.changes.items():
+                alerts.extend(index.newly_matching(item, field, old, new))
+        else:
+            continue
+
+        for alert in alerts:
+            matched[item.id][alert.id] = alert
+
+    logs = []
+    for item_id, alerts_by_id in matched.items():
+        logs.extend(_pending_logs(items[item_id], alerts_by_id.values()))
+
+    # match_count는 이미 로그가 있던 조합을 빼고 새로 추가된 (알림, 매물)만 반영
+    return len(_enqueue_matches(logs))
+
+
+def consume_alert_events(batch_size: int = ITEM_EVENT_BATCH_SIZE) -> int:
+    """
+    알림용 커서로 매물 변경 이벤트를 한 묶음 처리
+    반환: 처리한 이벤트 수
+    """
+    return consume_item_events(ALERT_EVENT_CONSUMER, handle_item_events, batch_size)
+
+
+def _claim_notification_logs(
+    qs: QuerySet[NotificationLog], limit: Optional[int] = None
+) -> List[int]:
+    """
+    qs 중 발송할 로그를 SENDING 상태로 점유하고 id 목록을 반환한다.
+    - SELECT ... FOR UPDATE SKIP LOCKED로 여러 디스패처가 같은 로그를 가져가지 않도록 함
+    - 점유 만료(claimed_until)가 지난 SENDING 로그는 워커가 죽은 것으로 보고 다시 가져감
+    """
+    now = timezone.now()
+    lease = getattr(settings, "NOTIFICATION_CLAIM_LEASE_SECONDS", 300)
+
+    qs = qs.filter(
+        Q(status=NotificationLog.Status.PENDING)
+        | Q(status=NotificationLog.Status.SENDING, claimed_until__lt=now)
+    )
+    with transaction.atomic():
+        ids = list(
+            qs.order_by("created_at")
+            .select_for_update(skip_locked=True, of=("self",))
+            .values_list("id", flat=True)[:limit]
+        )
+        if ids:
+            NotificationLog.objects.filter(id__in=ids).update(
+                status=NotificationLog.Status.SENDING,
+                claimed_until=now + timedelta(seconds=lease),
+                updated_at=now,
+            )
+    return ids
+
+
+def claim_pending_notifications(
+    limit: int = 200, log_ids: Optional[List[int]] = None
+) -> List[int]:
+    """
+    즉시 발송할 로그를 점유(_claim_notification_logs)하고 id 목록을 반환한다.
+    - log_ids를 넘기면 그 로그 중에서만 점유
+    """
+    # daily/weekly 알림 로그는 send_digest_notifications()에서 요약으로 발송
+    qs = NotificationLog.objects.exclude(alert__frequency__in=DIGEST_FREQUENCIES)
+    if log_ids is not None:
+        qs = qs.filter(id__in=log_ids)
+    return _claim_notification_logs(qs, limit)
 
 
 def send_pending_notifications(limit: int = 200) -> int:
     """
-    PENDING 상태의 NotificationLog를 실제 발송 처리한다.
+    PENDING 상태의 NotificationLog를 점유(claim)한 뒤 실제 발송 처리한다.
+    - 이메일은 SMTP 연결을 재사용하는 배치, 텔레그램은 asyncio 디스패처로 동시에 발송
+    - 결과는 bulk_update로 한 번에 기록
     반환: 처리한 로그 개수
     """
-    pending_status = NotificationLog.Status.PENDING
+    return _send_claimed_notifications(claim_pending_notifications(limit))
 
-    qs = (
-        NotificationLog.objects.filter(status=pending_status)
-        .select_related("user", "alert", "auction_item")
-        .order_by("created_at")[:limit]
+
+def drain_pending_notifications() -> int:
+    """
+    점유 가능한 PENDING 로그가 없을 때까지 send_pending_notifications() 반복
+    반환: 처리한 로그 개수
+    """
+    total = 0
+    while True:
+        sent = send_pending_notifications()
+        if not sent:
+            return total
+        total += sent
+
+
+def _send_claimed_notifications(ids: List[int]) -> int:
+    """
+    점유(SENDING)한 로그를 발송하고 결과를 bulk_update로 기록
+    반환: 처리한 로그 개수
+    """
+    if not ids:
+        return 0
+
+    logs = list(
+        NotificationLog.objects.filter(id__in=ids)
+        .select_related("alert__user__telegram_profile", "auction_item")
+        .order_by("created_at")
     )
 
-    processed = 0
-    now = timezone.now()
+    email_logs: List[NotificationLog] = []
+    email_messages = []
+    telegram_logs: List[NotificationLog] = []
+    telegram_messages = []
+    results: List[Tuple[NotificationLog, bool]] = []
+    fragments = load_item_fragments(log.auction_item for log in logs)
 
-    for log in qs:
+    for log in logs:
         alert = log.alert
         item = log.auction_item
 
-        try:
-            ok = False
-
-            if log.channel == NotificationLog.Channel.EMAIL:
-                ok = _send_email_for_alert(alert, [item])
-            elif log.channel == NotificationLog.Channel.TELEGRAM:
-                ok = _send_telegram_for_alert(alert, [item])
-
-            if ok:
-                log.status = NotificationLog.Status.SUCCESS
-                log.sent_at = now
-                log.error_message = None
-                log.message_body = "발송 성공"
-            else:
-                log.status = NotificationLog.Status.FAILED
-                log.error_message = "발송 실패"
-                log.message_body = "발송 실패"
-
-            log.save(
-                update_fields=[
-                    "status",
-                    "sent_at",
-                    "error_message",
-                    "message_body",
-                    "updated_at",
-                ]
-            )
-            processed += 1
+        if alert is None:
+            results.append((log, False))
+        elif log.channel == NotificationLog.Channel.EMAIL:
+            email_logs.append(log)
+            email_messages.append(_build_alert_email(alert, [item], fragments))
+        elif log.channel == NotificationLog.Channel.TELEGRAM:
+            telegram_logs.append(log)
+            telegram_messages.append(_build_alert_telegram(alert, [item], fragments))
+        else:
+            results.append((log, False))
+
+    email_results, telegram_results = _dispatch_messages(
+        email_messages, telegram_messages
+    )
+    results.extend(zip(email_logs, email_results))
+    results.extend(zip(telegram_logs, telegram_results))
+
+    now = timezone.now()
+    failed_ids = [log.id for log, ok in results if not ok]
+    if failed_ids:
+        NotificationLog.objects.filter(id__in=failed_ids).update(
+            status=NotificationLog.Status.FAILED,
+            error_message="발송 실패",
+            message_body="발송 실패",
+            claimed_until=None,
+            updated_at=now,
+        )
+    _mark_notifications_sent([log.id for log, ok in results if ok], "발송 성공")
+
+    return len(results)
+
 
-        except Exception as e:
-            log.status = NotificationLog.Status.FAILED
-            log.error_message = str(e)[:500]
-            log.message_body = "예외로 발송 실패"
-            log.save(
-                update_fields=["status", "error_message", "message_body", "updated_at"]
+#  요약(digest) 발송
+
+DIGEST_LABELS = {
+    AlertPreference.Frequency.DAILY: "일간",
+    AlertPreference.Frequency.WEEKLY: "주간",
+}
+
+
+def _build_digest_subject(frequency: str, count: int) -> str:
+    return f"[AucRadar] {DIGEST_LABELS.get(frequency, '')} 매물 요약 ({count}건)"
+
+
+def _build_digest_body(
+    user,
+    frequency: str,
+    items: List[AuctionItem],
+    fragments: Optional[ItemFragments] = None,
+) -> str:
+    lines = [
+        f"{_user_label(user)}님, 설정하신 조건에 맞는 매물 {len(items)}건을 "
+        f"{DIGEST_LABELS.get(frequency, '')} 요약으로 보내드립니다.\n"
+    ]
+    for item in items:
+        lines.append(_item_fragment(FRAGMENT_EMAIL, item, fragments))
+
+    lines.append("\nAucRadar 알림 설정에서 조건을 변경하거나 해제할 수 있습니다.")
+    return "\n".join(lines)
+
+
+def send_digest_notifications(
+    frequency: str, shard: Optional[Tuple[int, int]] = None
+) -> int:
+    """
+    frequency(daily/weekly) 알림의 PENDING 로그를 점유(SENDING)한 뒤
+    유저 + 채널 단위로 묶어
+    기간당 메시지 1건으로 발송하고, 포함된 로그는 일괄 UPDATE로 상태를 기록한다.
+    - shard=(i, N) 지정 시 user_id % N == i 인 유저만 발송
+    반환: 발송 시도한 메시지 수
+    """
+    index, count = _parse_shard(shard)
+    qs = NotificationLog.objects.filter(
+        alert__frequency=frequency,
+        alert__is_active=True,
+    )
+    if count > 1:
+        qs = qs.alias(shard=Mod("user_id", count)).filter(shard=index)
+
+    # 즉시 발송과 같은 방식으로 점유한 뒤 발송
+    # (겹쳐 실행된 요약 발송이 같은 로그를 다시 보내지 않음)
+    ids = _claim_notification_logs(qs)
+    if not ids:
+        return 0
+    logs = (
+        NotificationLog.objects.filter(id__in=ids)
+        .select_related("user__telegram_profile", "auction_item")
+        .order_by("user_id", "channel", "auction_item__auction_date", "id")
+    )
+
+    groups: Dict[Tuple[int, str], List[NotificationLog]] = defaultdict(list)
+    for log in logs:
+        groups[(log.user_id, log.channel)].append(log)
+
+    success_ids: List[int] = []
+    failed_ids: List[int] = []
+    email_groups: List[List[NotificationLog]] = []
+    email_messages = []
+    telegram_groups: List[List[NotificationLog]] = []
+    telegram_messages = []
+    fragments = load_item_fragments(
+        log.auction_item for group in groups.values() for log in group
+    )
+
+    for (_, channel), group in groups.items():
+        user = group[0].user
+
+        # 여러 알림에 동시에 걸린 매물은 한 번만
+        items: Dict[int, AuctionItem] = {}
+        for log in group:
+            items.setdefault(log.auction_item_id, log.auction_item)
+        item_list = list(items.values())
+
+        if channel == NotificationLog.Channel.EMAIL:
+            email_groups.append(group)
+            email_messages.append(
+                build_email_message(
+                    user,
+                    _build_digest_subject(frequency, len(item_list)),
+                    _build_digest_body(user, frequency, item_list, fragments),
+                )
+            )
+        else:
+            telegram_groups.append(group)
+            telegram_messages.append(
+                _build_telegram_message(
+                    user,
+                    _build_digest_subject(frequency, len(item_list)),
+                    item_list,
+                    fragments,
+                )
             )
-            processed += 1
 
-    return processed
+    email_results, telegram_results = _dispatch_messages(
+        email_messages, telegram_messages
+    )
+    for channel_groups, results in (
+        (email_groups, email_results),
+        (telegram_groups, telegram_results),
+    ):
+        for group, ok in zip(channel_groups, results):
+            (success_ids if ok else failed_ids).extend(log.id for log in group)
+
+    now = timezone.now()
+    label = DIGEST_LABELS.get(frequency, "")
+    if failed_ids:
+        NotificationLog.objects.filter(id__in=failed_ids).update(
+            status=NotificationLog.Status.FAILED,
+            error_message="요약 발송 실패",
+            message_body=f"{label} 요약 발송 실패",
+            claimed_until=None,
+            updated_at=now,
+        )
+    _mark_notifications_sent(success_ids, f"{label} 요약 발송 성공")
+
+    return len(groups)
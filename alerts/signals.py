@@ -0,0 +1,52 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from alerts.matching import bump_alert_rules_version
+from alerts.models import AlertPreference
+from alerts.services import reconcile_alert_match_counts, sync_alert_rules
+
+
+def _bump_preference_version(instance) -> None:
+    # update()는 post_save를 다시 보내지 않음
+    AlertPreference.objects.filter(pk=instance.pk).update(version=F("version") + 1)
+    # 메모리의 인스턴스도 맞춰서 컴파일 캐시가 이전 규칙을 재사용하지 않도록
+    instance.version += 1
+
+
+@receiver(post_save, sender=AlertPreference)
+def alert_preference_saved(sender, instance, created, **kwargs):
+    if not created:
+        _bump_preference_version(instance)
+    sync_alert_rules([instance.pk])
+    transaction.on_commit(bump_alert_rules_version)
+    # 조건이 바뀌었을 수 있으므로 매칭 수는 커밋 후 다시 계산
+    transaction.on_commit(lambda: reconcile_alert_match_counts([instance.pk]))
+
+
+@receiver(post_delete, sender=AlertPreference)
+def alert_preference_deleted(sender, instance, **kwargs):
+    transaction.on_commit(bump_alert_rules_version)
+
+
+@receiver(m2m_changed, sender=AlertPreference.small_categories.through)
+def alert_small_categories_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            _bump_preference_version(instance)
+            sync_alert_rules([instance.pk])
+            transaction.on_commit(bump_alert_rules_version)
+            transaction.on_commit(lambda: reconcile_alert_match_counts([instance.pk]))
+        return
+
+    # 소분류 쪽에서 변경한 경우 (instance: CategorySmall, pk_set: 알림 id)
+    if action == "pre_clear":
+        pk_set = set(instance.alert_preferences.values_list("pk", flat=True))
+    elif action not in ("post_add", "post_remove"):
+        return
+    if pk_set:
+        AlertPreference.objects.filter(pk__in=pk_set).update(version=F("version") + 1)
+        # pre_clear 시점에는 연결이 아직 남아 있으므로 규칙 동기화는 커밋 후에
+        transaction.on_commit(lambda: sync_alert_rules(pk_set))
+        transaction.on_commit(bump_alert_rules_version)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, NamedTuple, Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+# Bot API sendMessage 본문 최대 길이
+TELEGRAM_MESSAGE_MAX_LENGTH = 4096
+TELEGRAM_REQUEST_TIMEOUT = 10
+# 429 응답(retry_after) 후 다시 보내는 횟수
+TELEGRAM_SEND_RETRIES = 1
+
+
+class TelegramMessage(NamedTuple):
+    chat_id: str
+    text: str
+
+
+class AsyncRateLimiter:
+    """
+    초당 rate건을 넘지 않도록 호출 간격을 벌린다.
+    (슬롯을 먼저 예약하고 그 시각까지 대기)
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _create_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _post_message(session: requests.Session, url: str, message: TelegramMessage):
+    return session.post(
+        url,
+        json={
+            "chat_id": message.chat_id,
+            "text": message.text[:TELEGRAM_MESSAGE_MAX_LENGTH],
+            "disable_web_page_preview": True,
+        },
+        timeout=TELEGRAM_REQUEST_TIMEOUT,
+    )
+
+
+def _retry_after(response) -> Optional[float]:
+    if response.status_code != 429:
+        return None
+    try:
+        return float(response.json()["parameters"]["retry_after"])
+    except Exception:
+        return 1.0
+
+
+async def send_telegram_messages_async(
+    messages: List[Optional[TelegramMessage]],
+) -> List[bool]:
+    """
+    커넥션 풀 하나를 공유하면서
+    동시 요청 수, 전체/채팅별 초당 발송 수를 제한해 발송한다.
+    반환: messages와 같은 순서의 성공 여부 (None 메시지는 False)
+    """
+    results = [False] * len(messages)
+    token = getattr(settings, "TELEGRAM_BOT_TOKEN", "")
+    if not token or not any(messages):
+        return results
+
+    base_url = getattr(settings, "TELEGRAM_API_BASE_URL", "https://api.telegram.org")
+    url = f"{base_url.rstrip('/')}/bot{token}/sendMessage"
+    concurrency = max(1, getattr(settings, "TELEGRAM_SEND_CONCURRENCY", 8))
+    chat_rate = getattr(settings, "TELEGRAM_CHAT_RATE", 1.0)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    global_limiter = AsyncRateLimiter(getattr(settings, "TELEGRAM_GLOBAL_RATE", 30.0))
+    chat_limiters: Dict[str, AsyncRateLimiter] = {}
+    session = _create_session(concurrency)
+
+    async def send(index: int, message: TelegramMessage) -> None:
+        limiter = chat_limiters.setdefault(message.chat_id, AsyncRateLimiter(chat_rate))
+        for _ in range(TELEGRAM_SEND_RETRIES + 1):
+            await limiter.wait()
+            await global_limiter.wait()
+            try:
+                async with semaphore:
+                    response = await asyncio.to_thread(
+                        _post_message, session, url, message
+                    )
+            except requests.RequestException:
+                return
+
+            retry_after = _retry_after(response)
+            if retry_after is None:
+                results[index] = response.ok
+                return
+            await asyncio.sleep(retry_after)
+
+    try:
+        await asyncio.gather(
+            *(send(i, m) for i, m in enumerate(messages) if m is not None)
+        )
+    finally:
+        session.close()
+    return results
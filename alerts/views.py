@@ -9,7 +9,13 @@ from .serializers import (
     AlertPreviewItemSerializer,
     NotificationLogSerializer,
 )
-from .services import find_matching_items_for_alert
+from .services import (
+    ALERT_PREVIEW_LIMIT,
+    SENT_STATUSES,
+    find_matching_items_for_alert,
+    get_cached_alert_preview,
+    set_cached_alert_preview,
+)
 
 
 class AlertPreferenceListCreateView(generics.ListCreateAPIView):
@@ -73,6 +79,10 @@ class AlertPreferencePreviewItemsView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        qs = find_matching_items_for_alert(alert)[:50]
-        ser = AlertPreviewItemSerializer(qs, many=True)
-        return Response(ser.data)
+        data, stamp = get_cached_alert_preview(alert)
+        if data is None:
+            # match_count와 같은 기준: 발송 대기/발송 중 매물도 미리보기에 포함
+            qs = find_matching_items_for_alert(alert, exclude_statuses=SENT_STATUSES)
+            data = AlertPreviewItemSerializer(qs[:ALERT_PREVIEW_LIMIT], many=True).data
+            set_cached_alert_preview(alert, stamp, data)
+        return Response(data)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from auctions.models import AuctionItem, AuctionItemEvent, ItemEventCursor
+
+# 변경 이벤트를 남기는 필드 → 이벤트 종류
+ITEM_EVENT_FIELDS = {
+    "min_bid_price": AuctionItemEvent.Type.PRICE_CHANGED,
+    "status": AuctionItemEvent.Type.STATUS_CHANGED,
+    "num_failures": AuctionItemEvent.Type.FAILURES_CHANGED,
+}
+
+ITEM_EVENT_BATCH_SIZE = 500
+
+# 아직 진행 중인 트랜잭션 중 가장 오래된 것의 id
+# (이보다 작은 txid의 트랜잭션은 모두 끝남)
+# - id는 INSERT 시점에 정해지고 커밋은 그 뒤라서
+#   id 순서만으로는 늦게 커밋된 이벤트를 건너뜀
+# - 이벤트마다 기록 트랜잭션 id(txid)를 남기고,
+#   끝난 트랜잭션의 이벤트만 (txid, id) 순서로 읽음
+#   → 커서 뒤에 나중에 끼어드는 이벤트가 없음
+#   (오래 걸리는 트랜잭션이 있으면 그만큼 늦게 읽음)
+SNAPSHOT_XMIN_SQL = "SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+
+
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (int, float, str, bool)):
+        return value
+    return str(value)
+
+
+def record_item_created(item: AuctionItem) -> AuctionItemEvent:
+    return AuctionItemEvent.objects.create(
+        auction_item=item,
+        event_type=AuctionItemEvent.Type.CREATED,
+        changes={
+            field: _json_value(getattr(item, field)) for field in ITEM_EVENT_FIELDS
+        },
+    )
+
+
+def build_item_change_events(
+    item: AuctionItem, old_values: Dict[str, Any]
+) -> List[AuctionItemEvent]:
+    """
+    old_values: {필드명: 변경 전 값} → 실제로 바뀐 필드만 이벤트로 만든다 (저장 전)
+    """
+    events = []
+    for field, event_type in ITEM_EVENT_FIELDS.items():
+        if field not in old_values:
+            continue
+        old, new = old_values[field], getattr(item, field)
+        if old == new:
+            continue
+        events.append(
+            AuctionItemEvent(
+                auction_item=item,
+                event_type=event_type,
+                changes={field: [_json_value(old), _json_value(new)]},
+            )
+        )
+    return events
+
+
+def record_item_changes(item: AuctionItem, old_values: Dict[str, Any]) -> int:
+    events = build_item_change_events(item, old_values)
+    if events:
+        AuctionItemEvent.objects.bulk_create(events)
+    return len(events)
+
+
+# 상태 일괄 전이 + STATUS_CHANGED 이벤트 적재를 한 문장으로 처리
+# - target: 대상 행을 FOR UPDATE로 잠그면서 이전 상태를 읽음
+#   (SELECT~UPDATE 사이 경합 없음)
+# - changed: set-based UPDATE ... RETURNING (id, 이전 상태)
+# - 이벤트는 RETURNING 결과를 INSERT ... SELECT로 적재
+#   (id 목록을 파이썬으로 가져오지 않음)
+STATUS_TRANSITION_SQL = """
+WITH target AS (
+    {target} FOR UPDATE
+), changed AS (
+    UPDATE {items} AS i
+    SET {assignments}
+    FROM target
+    WHERE i.id = target.id
+    RETURNING i.id, target.status AS old_status
+), inserted AS (
+    INSERT INTO {events} (created_at, updated_at, auction_item_id, event_type, changes)
+    SELECT %s, %s, changed.id, %s,
+           jsonb_build_object('status', jsonb_build_array(changed.old_status, %s::text))
+    FROM changed
+)
+SELECT count(*) FROM changed
+"""
+
+
+def transition_item_status(
+    qs: QuerySet[AuctionItem], to_status: str, **extra_updates: Any
+) -> int:
+    """
+    qs에 해당하는 매물을 to_status로 전이하고 같은 문장에서 상태 변경 이벤트를 남긴다.
+    extra_updates: 함께 갱신할 컬럼 (예: needs_refresh=False)
+    반환: 전이된 매물 수
+    """
+    now = timezone.now()
+    target_sql, target_params = (
+        qs.exclude(status=to_status)
+        .order_by()
+        .values("id", "status")
+        .query.sql_with_params()
+    )
+
+    updates = {"status": to_status, "updated_at": now, **extra_updates}
+    assignments = ", ".join(
+        f"{connection.ops.quote_name(AuctionItem._meta.get_field(name).column)} = %s"
+        for name in updates
+    )
+    sql = STATUS_TRANSITION_SQL.format(
+        target=target_sql,
+        items=connection.ops.quote_name(AuctionItem._meta.db_table),
+        assignments=assignments,
+        events=connection.ops.quote_name(AuctionItemEvent._meta.db_table),
+    )
+    params = [
+        *target_params,
+        *updates.values(),
+        now,
+        now,
+        AuctionItemEvent.Type.STATUS_CHANGED,
+        to_status,
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchone()[0]
+
+
+def consume_item_events(
+    consumer: str,
+    handler: Callable[[List[AuctionItemEvent]], Any],
+    batch_size: int = ITEM_EVENT_BATCH_SIZE,
+) -> int:
+    """
+    consumer 커서 이후의 이벤트를 batch_size개 읽어 handler에 넘기고 커서를 전진시킨다.
+    - 커서 행을 잠그므로 같은 consumer는 동시에 하나만 진행
+    - 커밋이 끝난 트랜잭션의 이벤트만 (txid, id) 순서로 읽음 (SNAPSHOT_XMIN_SQL)
+    - handler와 커서 갱신이 같은 트랜잭션 → handler가 실패하면 다음 실행에서 다시 처리
+    반환: 처리한 이벤트 수
+    """
+    with transaction.atomic():
+        cursor, _ = ItemEventCursor.objects.select_for_update().get_or_create(
+            consumer=consumer
+        )
+        with connection.cursor() as db_cursor:
+            db_cursor.execute(SNAPSHOT_XMIN_SQL)
+            xmin = db_cursor.fetchone()[0]
+
+        events = list(
+            AuctionItemEvent.objects.filter(
+                Q(txid__gt=cursor.last_event_txid)
+                | Q(txid=cursor.last_event_txid, id__gt=cursor.last_event_id),
+                txid__lt=xmin,
+            )
+            .select_related("auction_item")
+            .order_by("txid", "id")[:batch_size]
+        )
+        if not events:
+            return 0
+
+        handler(events)
+
+        cursor.last_event_txid = events[-1].txid
+        cursor.last_event_id = events[-1].id
+        cursor.save(update_fields=["last_event_txid", "last_event_id", "updated_at"])
+
+    return len(events)
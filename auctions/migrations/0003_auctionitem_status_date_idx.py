@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auctions", "0002_auctionitem_ai_analysis_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="auctionitem",
+            index=models.Index(
+                fields=["status", "auction_date"], name="auction_item_status_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auctions", "0003_auctionitem_status_date_idx"),
+        ("operations", "0003_crawljob_metrics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auctionitem",
+            name="court_code",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                max_length=20,
+                null=True,
+                verbose_name="법원 코드",
+            ),
+        ),
+        migrations.AddField(
+            model_name="auctionitem",
+            name="last_seen_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="마지막 수집 확인 시각"
+            ),
+        ),
+        migrations.AddField(
+            model_name="auctionitem",
+            name="last_seen_job",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="seen_items",
+                to="operations.crawljob",
+                verbose_name="마지막 수집 작업",
+            ),
+        ),
+        migrations.AddField(
+            model_name="auctionitem",
+            name="needs_refresh",
+            field=models.BooleanField(
+                db_index=True, default=False, verbose_name="상태 재조회 필요"
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auctions", "0004_auctionitem_last_seen"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auctionitem",
+            name="next_refresh_at",
+            field=models.DateTimeField(
+                blank=True,
+                db_index=True,
+                null=True,
+                verbose_name="다음 상태 재조회 시각",
+            ),
+        ),
+        migrations.AddField(
+            model_name="auctionitem",
+            name="refresh_changes",
+            field=models.IntegerField(default=0, verbose_name="재조회 시 변경 횟수"),
+        ),
+        migrations.AddField(
+            model_name="auctionitem",
+            name="refresh_checks",
+            field=models.IntegerField(default=0, verbose_name="상태 재조회 횟수"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auctions", "0005_auctionitem_refresh_schedule"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auctionitem",
+            name="changed_at",
+            field=models.DateTimeField(
+                db_index=True,
+                default=django.utils.timezone.now,
+                verbose_name="조건 변경 시각",
+            ),
+        ),
+    ]
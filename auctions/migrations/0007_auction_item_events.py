@@ -0,0 +1,97 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auctions", "0006_auctionitem_changed_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ItemEventCursor",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "consumer",
+                    models.CharField(
+                        max_length=50, unique=True, verbose_name="소비자 이름"
+                    ),
+                ),
+                (
+                    "last_event_id",
+                    models.BigIntegerField(
+                        default=0, verbose_name="마지막 처리 이벤트 ID"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "매물 이벤트 소비 위치",
+                "verbose_name_plural": "매물 이벤트 소비 위치 목록",
+                "db_table": "auction_item_event_cursors",
+            },
+        ),
+        migrations.CreateModel(
+            name="AuctionItemEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("created", "신규 등록"),
+                            ("price_changed", "가격 변경"),
+                            ("status_changed", "상태 변경"),
+                            ("failures_changed", "유찰 횟수 변경"),
+                        ],
+                        max_length=30,
+                        verbose_name="이벤트 종류",
+                    ),
+                ),
+                (
+                    "changes",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="변경 내용"
+                    ),
+                ),
+                (
+                    "auction_item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="events",
+                        to="auctions.auctionitem",
+                        verbose_name="매물",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "매물 변경 이벤트",
+                "verbose_name_plural": "매물 변경 이벤트 목록",
+                "db_table": "auction_item_events",
+                "ordering": ["id"],
+            },
+        ),
+    ]
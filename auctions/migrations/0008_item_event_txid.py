@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auctions", "0007_auction_item_events"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auctionitemevent",
+            name="txid",
+            field=models.BigIntegerField(
+                db_default=models.Func(
+                    output_field=models.BigIntegerField(),
+                    template="pg_current_xact_id()::text::bigint",
+                ),
+                editable=False,
+                verbose_name="트랜잭션 ID",
+            ),
+        ),
+        # 기존 이벤트는 txid 0
+        # → 커서 (0, last_event_id)에서 기존 id 순서 그대로 이어서 읽음
+        migrations.RunSQL(
+            "UPDATE auction_item_events SET txid = 0",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddField(
+            model_name="itemeventcursor",
+            name="last_event_txid",
+            field=models.BigIntegerField(
+                default=0, verbose_name="마지막 처리 이벤트 트랜잭션 ID"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auctionitemevent",
+            index=models.Index(
+                fields=["txid", "id"], name="auction_item_event_txid_idx"
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 from core.models import TimeStampedModel
 
@@ -133,17 +134,110 @@ class AuctionItem(TimeStampedModel):
     )
 
     external_id = models.CharField("외부 매물 ID", max_length=100, unique=True)
+    court_code = models.CharField(
+        "법원 코드", max_length=20, null=True, blank=True, db_index=True
+    )
     detail_url = models.URLField(
         "상세 페이지 URL", max_length=500, null=True, blank=True
     )
     ai_predicted_price = models.BigIntegerField("AI 예상 낙찰가", null=True, blank=True)
     ai_analysis = models.TextField("AI 분석 코멘트", null=True, blank=True)
 
+    last_seen_at = models.DateTimeField("마지막 수집 확인 시각", null=True, blank=True)
+    last_seen_job = models.ForeignKey(
+        "operations.CrawlJob",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="seen_items",
+        verbose_name="마지막 수집 작업",
+    )
+    needs_refresh = models.BooleanField(
+        "상태 재조회 필요", default=False, db_index=True
+    )
+    next_refresh_at = models.DateTimeField(
+        "다음 상태 재조회 시각", null=True, blank=True, db_index=True
+    )
+    refresh_checks = models.IntegerField("상태 재조회 횟수", default=0)
+    refresh_changes = models.IntegerField("재조회 시 변경 횟수", default=0)
+
+    # 알림 매칭 조건(소재지/카테고리/가격/유찰/경매일)이 마지막으로 바뀐 시각
+    changed_at = models.DateTimeField(
+        "조건 변경 시각", default=timezone.now, db_index=True
+    )
+
     class Meta:
         db_table = "auction_items"
         verbose_name = "매물"
         verbose_name_plural = "매물 목록"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["status", "auction_date"], name="auction_item_status_date_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title}/{self.source}"
+
+
+class AuctionItemEvent(TimeStampedModel):
+    """
+    매물 변경 outbox (append-only)
+    - 매물 upsert와 같은 트랜잭션에서 기록
+    - 알림/캐시/통계 등 소비자는 ItemEventCursor 기준으로 id 순서대로 읽어 감
+    """
+
+    class Type(models.TextChoices):
+        CREATED = "created", "신규 등록"
+        PRICE_CHANGED = "price_changed", "가격 변경"
+        STATUS_CHANGED = "status_changed", "상태 변경"
+        FAILURES_CHANGED = "failures_changed", "유찰 횟수 변경"
+
+    auction_item = models.ForeignKey(
+        AuctionItem,
+        on_delete=models.CASCADE,
+        related_name="events",
+        verbose_name="매물",
+    )
+    event_type = models.CharField("이벤트 종류", max_length=30, choices=Type.choices)
+    # {필드명: [이전 값, 새 값]} (created는 {필드명: 값})
+    changes = models.JSONField("변경 내용", default=dict, blank=True)
+    # 이벤트를 기록한 트랜잭션 id (DB 기본값) → 소비자는 (txid, id) 순서로 읽음
+    txid = models.BigIntegerField(
+        "트랜잭션 ID",
+        db_default=models.Func(
+            template="pg_current_xact_id()::text::bigint",
+            output_field=models.BigIntegerField(),
+        ),
+        editable=False,
+    )
+
+    class Meta:
+        db_table = "auction_item_events"
+        verbose_name = "매물 변경 이벤트"
+        verbose_name_plural = "매물 변경 이벤트 목록"
+        ordering = ["id"]
+        indexes = [
+            # consume_item_events의 (txid, id) 커서 조회용
+            models.Index(fields=["txid", "id"], name="auction_item_event_txid_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.id} {self.auction_item_id} ({self.event_type})"
+
+
+class ItemEventCursor(TimeStampedModel):
+    consumer = models.CharField("소비자 이름", max_length=50, unique=True)
+    last_event_txid = models.BigIntegerField(
+        "마지막 처리 이벤트 트랜잭션 ID", default=0
+    )
+    last_event_id = models.BigIntegerField("마지막 처리 이벤트 ID", default=0)
+
+    class Meta:
+        db_table = "auction_item_event_cursors"
+        verbose_name = "매물 이벤트 소비 위치"
+        verbose_name_plural = "매물 이벤트 소비 위치 목록"
+
+    def __str__(self):
+        return f"{self.consumer}: {self.last_event_id}"
@@ -157,11 +157,44 @@ CACHES = {
     }
 }
 
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+EMAIL_BACKEND = os.getenv(
+    "EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend"
+)
+EMAIL_HOST = os.getenv("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "25"))
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", default=False)
+# 알림 메일 배치 발송 시 동시에 여는 SMTP 연결 수
+EMAIL_SEND_CONNECTIONS = int(os.getenv("EMAIL_SEND_CONNECTIONS", "2"))
+# 디스패처가 점유한 발송 로그의 만료 시간(초), 지나면 다른 워커가 다시 가져감
+NOTIFICATION_CLAIM_LEASE_SECONDS = int(
+    os.getenv("NOTIFICATION_CLAIM_LEASE_SECONDS", "300")
+)
+
+TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
+# 로컬 스텁 봇 서버로 테스트할 때 변경
+TELEGRAM_API_BASE_URL = os.getenv("TELEGRAM_API_BASE_URL", "https://api.telegram.org")
+# 텔레그램 동시 요청 수 (커넥션 풀 크기와 동일)
+TELEGRAM_SEND_CONCURRENCY = int(os.getenv("TELEGRAM_SEND_CONCURRENCY", "8"))
+# 초당 발송 한도: 봇 전체 / 채팅방별
+TELEGRAM_GLOBAL_RATE = float(os.getenv("TELEGRAM_GLOBAL_RATE", "30"))
+TELEGRAM_CHAT_RATE = float(os.getenv("TELEGRAM_CHAT_RATE", "1"))
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
 
+# 크롤링에서 빠진 미종결 매물 처리
+# 비워두면 재조회 플래그만, 값이 있으면 해당 상태로 전이
+COURT_SWEEP_UNSEEN_STATUS = os.getenv("COURT_SWEEP_UNSEEN_STATUS", "") or None
+
+# 상태 리프레시 1회 실행당 최대 재조회 건수
+STATUS_REFRESH_BUDGET = int(os.getenv("STATUS_REFRESH_BUDGET", "500"))
+# 상세 페이지 상태 조회 동시 요청 수 (커넥션 풀 크기와 동일)
+COURT_DETAIL_WORKERS = int(os.getenv("COURT_DETAIL_WORKERS", "8"))
+# 법원별 검색 크롤링 동시 작업 수
+COURT_CRAWL_WORKERS = int(os.getenv("COURT_CRAWL_WORKERS", "4"))
+
 LOGIN_URL = "/accounts/login/"
 LOGIN_REDIRECT_URL = "/dashboard/"
 LOGOUT_REDIRECT_URL = "/"
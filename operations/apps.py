@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 
 
 class OperationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "operations"
+
+    def ready(self):
+        from auctions.models import AuctionItem
+
+        # 오타가 난 상태 값이 미종결 매물 전체에 기록되지 않도록 기동 시 검증
+        status = getattr(settings, "COURT_SWEEP_UNSEEN_STATUS", None)
+        if status and status not in AuctionItem.Status.values:
+            raise ImproperlyConfigured(
+                f"COURT_SWEEP_UNSEEN_STATUS 값이 올바르지 않습니다: {status!r} "
+                f"(가능한 값: {', '.join(AuctionItem.Status.values)})"
+            )
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from operations.models import CrawlJob
+from operations.services import advance_auction_status
+
+
+class Command(BaseCommand):
+    help = "경매일 경과에 따른 매물 상태 전이를 DB에서 일괄 처리 (크론 등록용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--note",
+            type=str,
+            default="",
+            help="CrawlJob.note에 남길 메모",
+        )
+
+    def handle(self, *args, **options):
+        note = options.get("note") or ""
+
+        job = advance_auction_status(note=note)
+
+        transitions = (job.metrics or {}).get("transitions", {})
+        detail = ", ".join(f"{k}={v}" for k, v in transitions.items()) or "-"
+        msg = (
+            f"Status advance job #{job.id} finished: "
+            f"status={job.status}, updated={job.updated_count} ({detail})"
+        )
+
+        if job.status == CrawlJob.Status.FAILED:
+            raise CommandError(f"{msg} | error={job.error_message or '-'}")
+
+        self.stdout.write(self.style.SUCCESS(msg))
@@ -22,21 +22,39 @@ class Command(BaseCommand):
             default="",
             help="CrawlJob.note에 남길 메모",
         )
+        parser.add_argument(
+            "--flagged-only",
+            action="store_true",
+            help="크롤링 sweep에서 재조회 대상으로 표시된 매물만 처리",
+        )
+        parser.add_argument(
+            "--budget",
+            type=int,
+            default=None,
+            help="이번 실행에서 재조회할 최대 매물 수 (기본 STATUS_REFRESH_BUDGET)",
+        )
 
     def handle(self, *args, **options):
         source = options.get("source")
         note = options.get("note") or ""
+        flagged_only = bool(options.get("flagged_only"))
 
         if source == "court":
             source_value = CrawlJob.Source.COURT
         else:
             source_value = None
 
-        job = run_status_refresh_job(source=source_value, note=note)
+        job = run_status_refresh_job(
+            source=source_value,
+            note=note,
+            flagged_only=flagged_only,
+            budget=options.get("budget"),
+        )
 
         msg = (
             f"Status refresh job #{job.id} finished: "
-            f"status={job.status}, error={job.error_message or '-'}"
+            f"status={job.status}, processed={job.total_fetched}, "
+            f"changed={job.updated_count}, error={job.error_message or '-'}"
         )
 
         if job.status == CrawlJob.Status.FAILED:
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("operations", "0002_alter_crawljob_source"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="crawljob",
+            name="metrics",
+            field=models.JSONField(blank=True, default=dict, verbose_name="작업 지표"),
+        ),
+    ]
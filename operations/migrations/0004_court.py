@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("operations", "0003_crawljob_metrics"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Court",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "code",
+                    models.CharField(
+                        max_length=20, unique=True, verbose_name="법원 코드"
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        blank=True, default="", max_length=50, verbose_name="법원명"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="수집 여부"),
+                ),
+                (
+                    "crawl_count",
+                    models.IntegerField(default=0, verbose_name="수집 횟수"),
+                ),
+                (
+                    "avg_items",
+                    models.FloatField(default=0, verbose_name="평균 매물 수"),
+                ),
+                (
+                    "avg_pages",
+                    models.FloatField(default=0, verbose_name="평균 페이지 수"),
+                ),
+                (
+                    "avg_latency_ms",
+                    models.FloatField(default=0, verbose_name="평균 요청 지연(ms)"),
+                ),
+                ("error_rate", models.FloatField(default=0, verbose_name="에러율")),
+                (
+                    "consecutive_empty",
+                    models.IntegerField(default=0, verbose_name="연속 0건 횟수"),
+                ),
+                (
+                    "last_crawled_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="마지막 수집 시각"
+                    ),
+                ),
+                (
+                    "next_poll_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="다음 수집 가능 시각"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "법원",
+                "verbose_name_plural": "법원 목록",
+                "db_table": "courts",
+                "ordering": ["code"],
+            },
+        ),
+    ]
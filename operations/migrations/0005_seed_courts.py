@@ -0,0 +1,89 @@
+from django.db import migrations
+
+# 기존 fetch_court_items 내부 COURT_LIST (수집 순서 유지)
+COURT_CODES = [
+    "B000210",
+    "B000211",
+    "B000215",
+    "B000212",
+    "B000213",
+    "B000214",
+    "B214807",
+    "B214804",
+    "B000240",
+    "B000241",
+    "B000250",
+    "B000251",
+    "B000252",
+    "B000253",
+    "B250826",
+    "B000254",
+    "B000260",
+    "B000261",
+    "B000262",
+    "B000263",
+    "B000264",
+    "B000270",
+    "B000271",
+    "B000272",
+    "B000273",
+    "B000280",
+    "B000281",
+    "B000282",
+    "B000283",
+    "B000284",
+    "B000285",
+    "B000310",
+    "B000311",
+    "B000312",
+    "B000313",
+    "B000314",
+    "B000315",
+    "B000316",
+    "B000317",
+    "B000320",
+    "B000410",
+    "B000412",
+    "B000414",
+    "B000411",
+    "B000420",
+    "B000431",
+    "B000421",
+    "B000422",
+    "B000423",
+    "B000424",
+    "B000510",
+    "B000511",
+    "B000512",
+    "B000513",
+    "B000514",
+    "B000520",
+    "B000521",
+    "B000522",
+    "B000523",
+    "B000530",
+]
+
+
+def seed_courts(apps, schema_editor):
+    Court = apps.get_model("operations", "Court")
+    Court.objects.bulk_create(
+        [Court(code=code) for code in COURT_CODES],
+        ignore_conflicts=True,
+    )
+
+
+def unseed_courts(apps, schema_editor):
+    Court = apps.get_model("operations", "Court")
+    Court.objects.filter(code__in=COURT_CODES).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("operations", "0004_court"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_courts, unseed_courts),
+    ]
@@ -39,6 +39,7 @@ class CrawlJob(TimeStampedModel):
 
     error_message = models.TextField("에러 메시지", null=True, blank=True)
     note = models.CharField("비고", max_length=200, null=True, blank=True)
+    metrics = models.JSONField("작업 지표", default=dict, blank=True)
 
     class Meta:
         db_table = "crawl_jobs"
@@ -86,3 +87,34 @@ class CrawlItemLog(TimeStampedModel):
 
     def __str__(self):
         return f"Job #{self.job_id} - {self.external_id} ({self.get_result_display()})"
+
+
+class Court(TimeStampedModel):
+    code = models.CharField("법원 코드", max_length=20, unique=True)
+    name = models.CharField("법원명", max_length=50, blank=True, default="")
+    is_active = models.BooleanField("수집 여부", default=True)
+
+    # 크롤링 이력 통계 (지수이동평균)
+    crawl_count = models.IntegerField("수집 횟수", default=0)
+    avg_items = models.FloatField("평균 매물 수", default=0)
+    avg_pages = models.FloatField("평균 페이지 수", default=0)
+    avg_latency_ms = models.FloatField("평균 요청 지연(ms)", default=0)
+    error_rate = models.FloatField("에러율", default=0)
+
+    consecutive_empty = models.IntegerField("연속 0건 횟수", default=0)
+    last_crawled_at = models.DateTimeField("마지막 수집 시각", null=True, blank=True)
+    next_poll_at = models.DateTimeField("다음 수집 가능 시각", null=True, blank=True)
+
+    class Meta:
+        db_table = "courts"
+        verbose_name = "법원"
+        verbose_name_plural = "법원 목록"
+        ordering = ["code"]
+
+    def __str__(self):
+        return self.name or self.code
+
+    @property
+    def expected_crawl_ms(self) -> float:
+        # 예상 처리 시간 = 평균 페이지 수 × 페이지당 지연
+        return max(self.avg_pages, 1) * self.avg_latency_ms
@@ -54,6 +54,7 @@ class CrawlJobListSerializer(serializers.ModelSerializer):
             "failed_count",
             "error_message",
             "note",
+            "metrics",
             "created_at",
             "updated_at",
         ]
@@ -67,6 +68,7 @@ class CrawlJobListSerializer(serializers.ModelSerializer):
             "updated_count",
             "failed_count",
             "error_message",
+            "metrics",
             "created_at",
             "updated_at",
         ]
@@ -94,6 +96,7 @@ class CrawlJobDetailSerializer(serializers.ModelSerializer):
             "failed_count",
             "error_message",
             "note",
+            "metrics",
             "item_logs",
             "created_at",
             "updated_at",
@@ -108,6 +111,7 @@ class CrawlJobDetailSerializer(serializers.ModelSerializer):
             "updated_count",
             "failed_count",
             "error_message",
+            "metrics",
             "item_logs",
             "created_at",
             "updated_at",
@@ -1,18 +1,35 @@
 from __future__ import annotations
 
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import quote as urlquote
 
 import requests
+import requests.adapters
 from django.conf import settings
-from django.db import transaction
+from django.db import models, transaction
+from django.db.models import F, Q
 from django.utils import timezone
+from lxml import html as lxml_html
 from openai import OpenAI
 
-from auctions.models import AuctionItem, CategoryLarge, CategoryMiddle, CategorySmall
-from operations.models import CrawlItemLog, CrawlJob
+from auctions.events import (
+    ITEM_EVENT_FIELDS,
+    record_item_changes,
+    record_item_created,
+    transition_item_status,
+)
+from auctions.models import (
+    AuctionItem,
+    CategoryLarge,
+    CategoryMiddle,
+    CategorySmall,
+)
+from operations.models import Court, CrawlItemLog, CrawlJob
 
 
 def _parse_int(text: Optional[str]) -> Optional[int]:
@@ -302,108 +319,204 @@ def _normalize_court_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return data
 
 
-def fetch_court_items(from_date: date, to_date: date) -> Iterable[Dict[str, Any]]:
-    session = _create_court_session()
-
-    # 법원 코드 리스트
-    COURT_LIST = [
-        "B000210",
-        "B000211",
-        "B000215",
-        "B000212",
-        "B000213",
-        "B000214",
-        "B214807",
-        "B214804",
-        "B000240",
-        "B000241",
-        "B000250",
-        "B000251",
-        "B000252",
-        "B000253",
-        "B250826",
-        "B000254",
-        "B000260",
-        "B000261",
-        "B000262",
-        "B000263",
-        "B000264",
-        "B000270",
-        "B000271",
-        "B000272",
-        "B000273",
-        "B000280",
-        "B000281",
-        "B000282",
-        "B000283",
-        "B000284",
-        "B000285",
-        "B000310",
-        "B000311",
-        "B000312",
-        "B000313",
-        "B000314",
-        "B000315",
-        "B000316",
-        "B000317",
-        "B000320",
-        "B000410",
-        "B000412",
-        "B000414",
-        "B000411",
-        "B000420",
-        "B000431",
-        "B000421",
-        "B000422",
-        "B000423",
-        "B000424",
-        "B000510",
-        "B000511",
-        "B000512",
-        "B000513",
-        "B000514",
-        "B000520",
-        "B000521",
-        "B000522",
-        "B000523",
-        "B000530",
-    ]
-
-    for court_code in COURT_LIST:
-        page_no = 1
-        while True:
-            try:
-                result = _request_court_page(
-                    session, court_code, from_date, to_date, page_no
-                )
-            except Exception:
-                # 개별 법원 타임아웃/에러 시 다음 법원으로 이동
-                break
+# 법원별 통계 지수이동평균 가중치 / 0건 법원 수집 간격
+COURT_STATS_ALPHA = 0.3
+COURT_EMPTY_BACKOFF_BASE = timedelta(hours=6)
+COURT_EMPTY_BACKOFF_MAX = timedelta(days=7)
 
-            info = result.get("data") or {}
-            result_list: List[Dict[str, Any]] = info.get("dlt_srchResult") or []
 
-            if not result_list:
-                break
+def plan_court_crawl(now: Optional[datetime] = None) -> Tuple[List[Court], int]:
+    """
+    이번 크롤링에서 돌 법원 목록을 예상 처리 시간이 긴 순서(LPT)로 반환한다.
+    - 이력이 없는 법원은 가장 오래 걸린다고 보고 맨 앞에 배치
+    - 연속으로 0건을 반환해 next_poll_at이 미래인 법원은 건너뜀
+    반환: (법원 목록, 건너뛴 법원 수)
+    """
+    now = now or timezone.now()
+    courts = list(Court.objects.filter(is_active=True))
 
-            for row in result_list:
-                norm = _normalize_court_item(row)
-                if norm:
-                    yield norm
+    due = [c for c in courts if c.next_poll_at is None or c.next_poll_at <= now]
+    due.sort(key=lambda c: (c.crawl_count > 0, -c.expected_crawl_ms))
+    return due, len(courts) - len(due)
 
-            page_info = info.get("dma_pageInfo") or {}
-            total_cnt = int(page_info.get("totalCnt") or 0)
 
-            if page_no * 40 >= total_cnt:
-                break
-            page_no += 1
+def record_court_crawl(court: Court, stats: Dict[str, Any]) -> None:
+    """
+    법원 1곳 수집 결과를 이력 통계에 반영한다.
+    """
+    now = timezone.now()
+    alpha = COURT_STATS_ALPHA if court.crawl_count else 1.0
+
+    def ema(prev: float, value: float) -> float:
+        return (1 - alpha) * prev + alpha * value
+
+    court.avg_items = ema(court.avg_items, stats["items"])
+    court.avg_pages = ema(court.avg_pages, stats["pages"])
+    if stats["pages"]:
+        court.avg_latency_ms = ema(
+            court.avg_latency_ms, stats["elapsed_ms"] / stats["pages"]
+        )
+    court.error_rate = ema(court.error_rate, 1.0 if stats["error"] else 0.0)
+    court.crawl_count += 1
+    court.last_crawled_at = now
+
+    if stats["completed"] and stats["items"] == 0:
+        court.consecutive_empty += 1
+        backoff = COURT_EMPTY_BACKOFF_BASE * (2 ** (court.consecutive_empty - 1))
+        court.next_poll_at = now + min(backoff, COURT_EMPTY_BACKOFF_MAX)
+    elif stats["items"]:
+        court.consecutive_empty = 0
+        court.next_poll_at = None
+
+    court.save(
+        update_fields=[
+            "avg_items",
+            "avg_pages",
+            "avg_latency_ms",
+            "error_rate",
+            "crawl_count",
+            "last_crawled_at",
+            "consecutive_empty",
+            "next_poll_at",
+            "updated_at",
+        ]
+    )
+
+
+def _parse_court_listing(
+    result: Any,
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    검색 응답에서 (row 목록, 전체 건수)를 꺼낸다.
+    - 에러/점검 응답처럼 형식이 맞지 않으면 ValueError (빈 결과로 취급하지 않음)
+    - 전체 건수(dma_pageInfo.totalCnt)가 없으면 None
+    """
+    if not isinstance(result, dict) or result.get("errors"):
+        raise ValueError("법원 검색 응답 형식 오류")
+    if str(result.get("status", 200)) != "200":
+        raise ValueError(f"법원 검색 응답 오류: {result.get('status')}")
+
+    info = result.get("data")
+    rows = info.get("dlt_srchResult") if isinstance(info, dict) else None
+    if not isinstance(rows, list):
+        raise ValueError("법원 검색 응답에 결과 목록이 없습니다.")
+
+    page_info = info.get("dma_pageInfo")
+    total_cnt = page_info.get("totalCnt") if isinstance(page_info, dict) else None
+    try:
+        return rows, int(total_cnt)
+    except (TypeError, ValueError):
+        return rows, None
+
+
+def _crawl_court_rows(
+    session: requests.Session, court_code: str, from_date: date, to_date: date
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    법원 1곳의 기간 내 검색 결과 원본 row를 모두 가져온다. (HTTP만, DB 접근 없음)
+    - 형식이 맞는 응답을 전체 건수까지 모두 받은 경우에만 completed (미노출 sweep 기준)
+    """
+    rows: List[Dict[str, Any]] = []
+    stats = {"pages": 0, "items": 0, "elapsed_ms": 0.0, "error": False}
+    completed = False
+
+    page_no = 1
+    started = time.perf_counter()
+    while True:
+        try:
+            result = _request_court_page(
+                session, court_code, from_date, to_date, page_no
+            )
+            result_list, total_cnt = _parse_court_listing(result)
+        except Exception:
+            # 개별 법원 타임아웃/에러/점검 응답 시 다음 법원으로 이동 (완료로 보지 않음)
+            stats["error"] = True
+            break
+        stats["pages"] += 1
+
+        if total_cnt is None:
+            # 전체 건수가 없으면 끝까지 받았는지 알 수 없음 → sweep 대상에서 제외
+            rows.extend(result_list)
+            stats["error"] = True
+            break
+
+        if not result_list:
+            # 빈 페이지는 전체 건수와 맞을 때만 완료 (앞 페이지까지 다 받은 경우)
+            completed = total_cnt <= (page_no - 1) * 40
+            stats["error"] = not completed
+            break
+
+        rows.extend(result_list)
+
+        if page_no * 40 >= total_cnt:
+            completed = True
+            break
+        page_no += 1
+
+    stats["elapsed_ms"] = (time.perf_counter() - started) * 1000
+    stats["items"] = len(rows)
+    stats["completed"] = completed
+    return rows, stats
+
+
+def fetch_court_items(
+    from_date: date,
+    to_date: date,
+    completed_courts: Optional[set] = None,
+    metrics: Optional[Dict[str, Any]] = None,
+) -> Iterable[Dict[str, Any]]:
+    """
+    completed_courts가 주어지면 기간 내 전체 페이지를 끝까지 수집한 법원 코드를 담는다.
+    (중간에 에러로 끊긴 법원은 제외 → 미노출 매물 sweep 대상에서도 제외)
+
+    법원별 HTTP 수집은 COURT_CRAWL_WORKERS개 스레드에서 LPT 순서로 병렬 처리하고,
+    정규화(카테고리 조회 등 DB 접근)와 통계 기록은 호출 스레드에서만 한다.
+    """
+    courts, skipped = plan_court_crawl()
+    workers = max(1, getattr(settings, "COURT_CRAWL_WORKERS", 1))
+
+    if metrics is not None:
+        metrics["courts"] = {"planned": len(courts), "skipped_backoff": skipped}
+
+    # 워커 스레드마다 세션 1개를 만들어 재사용하고, 호출이 끝나면 모두 닫는다
+    local = threading.local()
+    sessions: List[requests.Session] = []
+
+    def init_worker() -> None:
+        local.session = _create_court_session()
+        sessions.append(local.session)
+
+    def crawl(court_code: str):
+        return _crawl_court_rows(local.session, court_code, from_date, to_date)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            futures = {pool.submit(crawl, court.code): court for court in courts}
+            for future in as_completed(futures):
+                court = futures[future]
+                rows, stats = future.result()
+                record_court_crawl(court, stats)
+
+                for row in rows:
+                    norm = _normalize_court_item(row)
+                    if norm:
+                        norm["court_code"] = court.code
+                        yield norm
+
+                if stats["completed"] and completed_courts is not None:
+                    completed_courts.add(court.code)
+    finally:
+        for session in sessions:
+            session.close()
 
 
 def update_expected_bid_price(item: AuctionItem) -> None:
     predicted = predict_expected_bid_price(item)
     if predicted and predicted != item.ai_predicted_price:
         item.ai_predicted_price = predicted
-        item.save(update_fields=["ai_predicted_price"])
+        # updated_at도 같이 저장
+        # → 매물 조각 캐시 키(id, updated_at)가 바뀌어 예상가가 갱신됨
+        item.save(update_fields=["ai_predicted_price", "updated_at"])
 
 
 #  1. 크롤링 Job 실행 (법원 전용)
@@ -435,14 +548,38 @@ def run_crawl_job(
         today = date.today()
         from_date = today
         to_date = today + timedelta(days=days)
-        raw_items = list(fetch_court_items(from_date, to_date))
+        completed_courts: set = set()
+        crawl_metrics: Dict[str, Any] = {}
+        raw_items = list(
+            fetch_court_items(from_date, to_date, completed_courts, crawl_metrics)
+        )
+        job.metrics = crawl_metrics
 
         if dry_run:
             job.total_fetched = len(raw_items)
         else:
+            # 알림 매칭은 매물 변경 이벤트(AuctionItemEvent) 소비자에서 처리
             for raw in raw_items:
                 process_single_item(job, raw)
 
+            mark_items_seen(job, [raw.get("external_id") for raw in raw_items])
+            flagged = sweep_unseen_items(
+                job,
+                completed_courts,
+                from_date,
+                to_date,
+                transition_to=getattr(settings, "COURT_SWEEP_UNSEEN_STATUS", None),
+            )
+            job.metrics = {
+                **(job.metrics or {}),
+                "sweep": {"completed_courts": len(completed_courts), "unseen": flagged},
+            }
+
+            # 알림 미리보기 캐시 무효화
+            from alerts.matching import bump_items_generation
+
+            bump_items_generation()
+
         job.status = CrawlJob.Status.SUCCESS
 
     except Exception as e:
@@ -456,11 +593,85 @@ def run_crawl_job(
     return job
 
 
+SEEN_MARK_CHUNK_SIZE = 1000
+
+
+def mark_items_seen(job: CrawlJob, external_ids: List[Optional[str]]) -> int:
+    """
+    이번 크롤링에서 검색 결과에 나타난 매물에 last_seen 마커를 일괄 기록한다.
+    크롤링 결과로 최신화됐으므로 재조회 플래그도 해제.
+    """
+    ids = [eid for eid in external_ids if eid]
+    now = timezone.now()
+    marked = 0
+
+    for i in range(0, len(ids), SEEN_MARK_CHUNK_SIZE):
+        marked += AuctionItem.objects.filter(
+            external_id__in=ids[i : i + SEEN_MARK_CHUNK_SIZE]
+        ).update(last_seen_at=now, last_seen_job=job, needs_refresh=False)
+
+    return marked
+
+
+def sweep_unseen_items(
+    job: CrawlJob,
+    court_codes: Iterable[str],
+    from_date: date,
+    to_date: date,
+    transition_to: Optional[str] = None,
+) -> int:
+    """
+    전체 페이지를 수집한 법원 + 기간 범위 안에서
+    이번 job에 보이지 않은 미종결 매물을 찾는다.
+    (취하/매각/취소 등으로 검색 결과에서 빠진 매물)
+    - 기본: needs_refresh 플래그만 세워 상태 리프레시 대상으로 지정
+    - transition_to 지정 시: 해당 상태로 바로 전이
+    반환: 대상 매물 수
+    """
+    court_codes = list(court_codes)
+    if not court_codes:
+        return 0
+
+    qs = AuctionItem.objects.filter(
+        source=AuctionItem.Source.COURT,
+        court_code__in=court_codes,
+        auction_date__gte=from_date,
+        auction_date__lte=to_date,
+        status__in=[
+            AuctionItem.Status.PLANNED,
+            AuctionItem.Status.ACTIVE,
+            AuctionItem.Status.FAILED,
+        ],
+    ).exclude(last_seen_job=job)
+
+    if transition_to:
+        # 전이 + 상태 변경 이벤트를 한 문장으로 처리
+        return transition_item_status(qs, transition_to, needs_refresh=False)
+    return qs.update(needs_refresh=True, updated_at=timezone.now())
+
+
 #  2. 개별 매물 처리 (upsert + AI 분석 + 로그)
 
+# 알림 매칭 조건에 쓰이는 필드 (바뀌면 AuctionItem.changed_at 갱신)
+ALERT_MATERIAL_FIELDS = {
+    "location",
+    "min_bid_price",
+    "num_failures",
+    "auction_date",
+    "large",
+    "middle",
+    "small",
+}
+
 
 @transaction.atomic
-def process_single_item(job: CrawlJob, data: Dict[str, Any]) -> None:
+def process_single_item(
+    job: CrawlJob, data: Dict[str, Any]
+) -> Tuple[Optional[AuctionItem], str]:
+    """
+    반환: (매물, CrawlItemLog.Result)
+    기존 매물과 값이 같으면 저장 없이 SKIPPED 처리
+    """
     external_id = data.get("external_id")
     if not external_id:
         CrawlItemLog.objects.create(
@@ -473,49 +684,15 @@ def process_single_item(job: CrawlJob, data: Dict[str, Any]) -> None:
         job.failed_count += 1
         job.total_fetched += 1
         job.save(update_fields=["failed_count", "total_fetched"])
-        return
+        return None, CrawlItemLog.Result.FAILED
 
     job.total_fetched += 1
+    item = None
 
     try:
-        item, created = AuctionItem.objects.get_or_create(
-            external_id=external_id,
-            defaults=data,
-        )
-
-        if not created:
-            for field, value in data.items():
-                setattr(item, field, value)
-            item.save()
-            result = CrawlItemLog.Result.UPDATED
-            job.updated_count += 1
-        else:
-            result = CrawlItemLog.Result.CREATED
-            job.created_count += 1
-
-        # 로그 생성
-        CrawlItemLog.objects.create(
-            job=job,
-            auction_item=item,
-            external_id=external_id,
-            result=result,
-            message="",
-        )
-
-        if created:
-            # 2) 알림 로그 생성
-            try:
-                from alerts.services import create_notification_logs_for_new_item
-
-                create_notification_logs_for_new_item(item)
-            except Exception:
-                pass
-
-        try:
-            update_expected_bid_price(item)
-        except Exception:
-            pass
-
+        # 저장/이벤트/로그를 세이브포인트로 묶어, 실패하면 변경 이벤트도 함께 롤백
+        with transaction.atomic():
+            item, result = _upsert_crawled_item(job, external_id, data)
     except Exception as e:
         CrawlItemLog.objects.create(
             job=job,
@@ -525,6 +702,19 @@ def process_single_item(job: CrawlJob, data: Dict[str, Any]) -> None:
             message=str(e)[:1000],
         )
         job.failed_count += 1
+        result = CrawlItemLog.Result.FAILED
+    else:
+        # 저장이 끝난 뒤에만 생성/갱신 건수 반영
+        if result == CrawlItemLog.Result.CREATED:
+            job.created_count += 1
+        elif result == CrawlItemLog.Result.UPDATED:
+            job.updated_count += 1
+
+        try:
+            with transaction.atomic():
+                update_expected_bid_price(item)
+        except Exception:
+            pass
 
     job.save(
         update_fields=[
@@ -534,12 +724,109 @@ def process_single_item(job: CrawlJob, data: Dict[str, Any]) -> None:
             "failed_count",
         ]
     )
+    return item, result
+
+
+def _upsert_crawled_item(
+    job: CrawlJob, external_id: str, data: Dict[str, Any]
+) -> Tuple[AuctionItem, str]:
+    item, created = AuctionItem.objects.get_or_create(
+        external_id=external_id,
+        defaults=data,
+    )
+
+    if not created:
+        changed = False
+        material = False
+        old_values: Dict[str, Any] = {}
+        for field, value in data.items():
+            # FK는 id로 비교 (관련 객체 조회 쿼리 방지)
+            if isinstance(value, models.Model):
+                current = getattr(item, f"{field}_id")
+                new_value = value.pk
+            else:
+                current = getattr(item, field)
+                new_value = value
+            if current != new_value:
+                if field in ITEM_EVENT_FIELDS:
+                    old_values[field] = current
+                setattr(item, field, value)
+                changed = True
+                material = material or field in ALERT_MATERIAL_FIELDS
+
+        if material:
+            item.changed_at = timezone.now()
+
+        if changed:
+            item.save()
+            record_item_changes(item, old_values)
+            result = CrawlItemLog.Result.UPDATED
+        else:
+            result = CrawlItemLog.Result.SKIPPED
+    else:
+        record_item_created(item)
+        result = CrawlItemLog.Result.CREATED
+
+    # 로그 생성
+    CrawlItemLog.objects.create(
+        job=job,
+        auction_item=item,
+        external_id=external_id,
+        result=result,
+        message="",
+    )
+    return item, result
 
 
 #  3. 상태 리프레시 Job
 
+# 경매일까지 남은 일수 → 기본 재조회 간격 (위에서부터 먼저 맞는 구간 적용)
+# 매각기일이 가까울수록 자주, 먼 미래 매물은 드물게 조회한다.
+REFRESH_TIERS = [
+    (-1, timedelta(hours=12)),  # 기일 경과: 매각/유찰 결과 대기
+    (1, timedelta(hours=2)),
+    (3, timedelta(hours=6)),
+    (7, timedelta(days=1)),
+    (14, timedelta(days=2)),
+]
+REFRESH_DEFAULT_INTERVAL = timedelta(days=4)
+REFRESH_MIN_INTERVAL = timedelta(hours=1)
+REFRESH_MAX_INTERVAL = timedelta(days=7)
+
+
+def compute_next_refresh_at(item: AuctionItem, now: datetime) -> datetime:
+    """
+    경매일 근접도 + 과거 변경 비율로 다음 재조회 시각을 계산한다.
+    - 변경 비율은 (변경 + 1) / (조회 + 2)로 보정 (조회 이력이 없으면 0.5)
+    - 자주 바뀌는 매물은 최대 절반 간격, 거의 안 바뀌는 매물은 최대 1.5배 간격
+    """
+    interval = REFRESH_DEFAULT_INTERVAL
+    if item.auction_date:
+        days_left = (item.auction_date - now.date()).days
+        for max_days, tier_interval in REFRESH_TIERS:
+            if days_left <= max_days:
+                interval = tier_interval
+                break
+
+    change_rate = (item.refresh_changes + 1) / (item.refresh_checks + 2)
+    interval = interval * (1.5 - change_rate)
+
+    interval = max(REFRESH_MIN_INTERVAL, min(interval, REFRESH_MAX_INTERVAL))
+    return now + interval
+
 
-def run_status_refresh_job(source: Optional[str] = None, note: str = "") -> CrawlJob:
+def run_status_refresh_job(
+    source: Optional[str] = None,
+    note: str = "",
+    flagged_only: bool = False,
+    budget: Optional[int] = None,
+) -> CrawlJob:
+    """
+    재조회 시각(next_refresh_at)이 도래한 매물만 budget 건수 안에서 처리한다.
+    우선순위: sweep 플래그 → 한 번도 조회 안 한 매물 → 재조회 시각이 오래된 순
+    """
+    if budget is None:
+        budget = getattr(settings, "STATUS_REFRESH_BUDGET", 500)
 
     job = CrawlJob.objects.create(
         source=source or CrawlJob.Source.COURT,
@@ -548,6 +835,7 @@ def run_status_refresh_job(source: Optional[str] = None, note: str = "") -> Craw
     )
 
     try:
+        now = timezone.now()
         today = date.today()
         near_past = today - timedelta(days=90)
         near_future = today + timedelta(days=30)
@@ -569,9 +857,47 @@ def run_status_refresh_job(source: Optional[str] = None, note: str = "") -> Craw
             auction_date__lte=near_future,
         )
 
-        for item in qs:
-            refresh_single_item_status(job, item)
+        # sweep 단계에서 검색 결과에서 빠진 것으로 확인된 매물만
+        if flagged_only:
+            qs = qs.filter(needs_refresh=True)
+        else:
+            qs = qs.filter(
+                Q(needs_refresh=True)
+                | Q(next_refresh_at__isnull=True)
+                | Q(next_refresh_at__lte=now)
+            )
+
+        due_count = qs.count()
+        qs = qs.order_by(
+            "-needs_refresh",
+            F("next_refresh_at").asc(nulls_first=True),
+            "auction_date",
+        )[:budget]
+
+        items = list(qs)
+        refresh_metrics: Dict[str, Any] = {"due": due_count, "budget": budget}
+        court_statuses = fetch_court_item_statuses(
+            [item for item in items if item.source == AuctionItem.Source.COURT],
+            refresh_metrics,
+        )
 
+        processed = 0
+        changed_count = 0
+        for item in items:
+            if refresh_single_item_status(job, item, court_statuses.get(item.pk, {})):
+                changed_count += 1
+            processed += 1
+
+        refresh_metrics["processed"] = processed
+        refresh_metrics["changed"] = changed_count
+        if changed_count:
+            from alerts.matching import bump_items_generation
+
+            bump_items_generation()
+
+        job.total_fetched = processed
+        job.updated_count = changed_count
+        job.metrics = {"refresh": refresh_metrics}
         job.status = CrawlJob.Status.SUCCESS
 
     except Exception as e:
@@ -585,39 +911,72 @@ def run_status_refresh_job(source: Optional[str] = None, note: str = "") -> Craw
     return job
 
 
-def refresh_single_item_status(job: CrawlJob, item: AuctionItem) -> None:
+def refresh_single_item_status(
+    job: CrawlJob,
+    item: AuctionItem,
+    new_status_data: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    new_status_data: 미리 일괄 조회한 상태 (없으면 이 매물만 단건 조회)
+    반환: 상태 변경 여부
+    """
+    changed = False
     try:
         # 법원 경매만 처리
-        if item.source == AuctionItem.Source.COURT:
-            new_status_data = fetch_court_item_status(item.external_id)
-        else:
-            return
+        if item.source != AuctionItem.Source.COURT:
+            return False
+        if new_status_data is None:
+            new_status_data = fetch_court_item_status(item)
 
-        changed = False
+        old_values = {"status": item.status, "num_failures": item.num_failures}
+        has_changes = False
 
         status_code = new_status_data.get("status")
         if status_code and status_code != item.status:
             item.status = status_code
-            changed = True
+            has_changes = True
 
         raw_status = new_status_data.get("raw_status")
         if raw_status is not None and raw_status != getattr(item, "raw_status", None):
             item.raw_status = raw_status
-            changed = True
+            has_changes = True
 
         num_failures = new_status_data.get("num_failures")
         if num_failures is not None and num_failures != item.num_failures:
             item.num_failures = num_failures
+            item.changed_at = timezone.now()
+            has_changes = True
+
+        # 실제로 재조회된 경우에만 sweep 플래그 해제
+        if new_status_data:
+            item.needs_refresh = False
+
+        item.refresh_checks += 1
+        if has_changes:
+            item.refresh_changes += 1
+        item.next_refresh_at = compute_next_refresh_at(item, timezone.now())
+
+        if has_changes:
+            with transaction.atomic():
+                item.save()
+                record_item_changes(item, old_values)
+                CrawlItemLog.objects.create(
+                    job=job,
+                    auction_item=item,
+                    external_id=item.external_id,
+                    result=CrawlItemLog.Result.UPDATED,
+                    message="상태 리프레시",
+                )
+            # 저장/이벤트 기록이 커밋된 뒤에만 변경으로 집계
             changed = True
-
-        if changed:
-            item.save()
-            CrawlItemLog.objects.create(
-                job=job,
-                auction_item=item,
-                external_id=item.external_id,
-                result=CrawlItemLog.Result.UPDATED,
-                message="상태 리프레시",
+        else:
+            item.save(
+                update_fields=[
+                    "needs_refresh",
+                    "refresh_checks",
+                    "next_refresh_at",
+                    "updated_at",
+                ]
             )
 
     except Exception as e:
@@ -628,9 +987,356 @@ def refresh_single_item_status(job: CrawlJob, item: AuctionItem) -> None:
             result=CrawlItemLog.Result.FAILED,
             message=f"상태 리프레시 실패: {str(e)[:200]}",
         )
+        # 실패한 매물도 다음 주기로 미뤄 같은 매물만 반복 조회하지 않도록
+        AuctionItem.objects.filter(pk=item.pk).update(
+            next_refresh_at=timezone.now() + REFRESH_MIN_INTERVAL
+        )
+
+    return changed
+
+
+#  3-1. 상태 조회 엔진
+#  - 1차: 법원/기간 단위 그룹 검색(JSON)으로 여러 매물을 한 번에 확인
+#  - 2차: 그룹 검색에서 찾지 못한 매물만 상세 페이지를 병렬로 조회(lxml 파싱)
+
+COURT_GROUP_SEARCH_MIN_ITEMS = 2
+COURT_GROUP_SEARCH_MAX_PAGES = 10
+
+# 상세 페이지에서 진행 상태가 적힌 항목 라벨 (공백 제거 기준)
+COURT_DETAIL_STATUS_LABELS = ("물건상태", "진행상태", "진행결과", "기일결과")
+
+# 상태 문자열 키워드 → AuctionItem.Status (위에서부터 먼저 맞는 키워드 적용)
+COURT_DETAIL_STATUS_KEYWORDS = [
+    ("취하", AuctionItem.Status.FAILED),
+    ("기각", AuctionItem.Status.FAILED),
+    ("취소", AuctionItem.Status.FAILED),
+    ("낙찰", AuctionItem.Status.SOLD),
+    ("매각허가", AuctionItem.Status.SOLD),
+    ("대금납부", AuctionItem.Status.SOLD),
+    ("배당", AuctionItem.Status.SOLD),
+    ("유찰", AuctionItem.Status.FAILED),
+]
+
+_DETAIL_DATE_RE = re.compile(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})")
+
+
+def _court_row_status(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    검색 결과 row에서 상태 관련 필드만 추출 (카테고리 조회 등 DB 접근 없음)
+    """
+    court_code = row.get("boCd")
+    docid = row.get("docid")
+    if not (court_code and docid):
+        return None
+
+    auction_date = _parse_date(row.get("maeGiil"))
+    return {
+        "external_id": f"{court_code}-{docid}",
+        "status": map_court_status(row.get("mulStatcd"), auction_date),
+        "raw_status": row.get("jinstatCd") or "",
+        "num_failures": parse_fail_count(row.get("yuchalCnt")),
+    }
+
+
+def _search_court_statuses(
+    session: requests.Session,
+    court_code: str,
+    from_date: date,
+    to_date: date,
+    wanted_ids: set,
+) -> Dict[str, Dict[str, Any]]:
+    found: Dict[str, Dict[str, Any]] = {}
+
+    for page_no in range(1, COURT_GROUP_SEARCH_MAX_PAGES + 1):
+        try:
+            result = _request_court_page(
+                session, court_code, from_date, to_date, page_no
+            )
+        except Exception:
+            break
+
+        info = result.get("data") or {}
+        result_list: List[Dict[str, Any]] = info.get("dlt_srchResult") or []
+        if not result_list:
+            break
+
+        for row in result_list:
+            status_data = _court_row_status(row)
+            if status_data and status_data["external_id"] in wanted_ids:
+                found[status_data["external_id"]] = status_data
+
+        if len(found) >= len(wanted_ids):
+            break
+
+        page_info = info.get("dma_pageInfo") or {}
+        total_cnt = int(page_info.get("totalCnt") or 0)
+        if page_no * 40 >= total_cnt:
+            break
+
+    return found
+
+
+def parse_court_detail_status(
+    content: bytes, auction_date: Optional[date] = None, encoding: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    RetrieveRealEstDetailInqSaList.laf 상세 페이지에서 상태/유찰횟수를 추출한다.
+    BeautifulSoup 대신 lxml(C 파서)로 th → td 라벨 쌍만 훑는다.
+    - encoding: 응답 인코딩 (없으면 lxml이 <meta charset>으로 판단)
+    """
+    parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+    doc = lxml_html.document_fromstring(content, parser=parser)
+
+    fields: Dict[str, str] = {}
+    for th in doc.iter("th"):
+        td = th.getnext()
+        if td is None or td.tag != "td":
+            continue
+        label = "".join(th.itertext()).replace(" ", "").strip()
+        if label and label not in fields:
+            fields[label] = " ".join("".join(td.itertext()).split())
+
+    data: Dict[str, Any] = {}
+
+    if "유찰횟수" in fields:
+        data["num_failures"] = parse_fail_count(fields["유찰횟수"])
+
+    date_text = fields.get("매각기일") or ""
+    m = _DETAIL_DATE_RE.search(date_text)
+    if m:
+        auction_date = date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+    raw_status = next(
+        (fields[label] for label in COURT_DETAIL_STATUS_LABELS if fields.get(label)),
+        None,
+    )
+    if raw_status:
+        data["raw_status"] = raw_status[:100]
+        status = None
+        for keyword, mapped in COURT_DETAIL_STATUS_KEYWORDS:
+            if keyword in raw_status:
+                status = mapped
+                break
+        if status is None and "진행" in raw_status:
+            status = map_court_status("01", auction_date)
+        if status:
+            data["status"] = status
+
+    return data
+
+
+def _create_court_detail_session(pool_size: int) -> requests.Session:
+    # 워커 수만큼 keep-alive 커넥션을 재사용하도록 풀 크기 지정
+    s = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=pool_size, max_retries=1
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update(
+        {
+            "User-Agent": "Mozilla/5.0 (compatible; AucRadarBot/1.0)",
+            "Accept": "text/html,application/xhtml+xml",
+        }
+    )
+    return s
+
+
+_CHARSET_RE = re.compile(rb"charset\s*=", re.I)
+
+
+def court_response_encoding(resp: requests.Response) -> Optional[str]:
+    """
+    상세 페이지 디코딩에 쓸 인코딩
+    - Content-Type 헤더에 charset이 있으면 그 값
+    - 헤더/본문 어디에도 charset이 없으면 법원 사이트 기본값(EUC-KR)
+    - 본문 <meta>에만 있으면 None (lxml이 meta를 읽음)
+    (requests는 charset 없는 text/html을 ISO-8859-1로 보므로
+    resp.encoding을 그대로 쓰지 않음)
+    """
+    if "charset" in resp.headers.get("Content-Type", "").lower():
+        return resp.encoding
+    if _CHARSET_RE.search(resp.content[:2048]):
+        return None
+    return "euc-kr"
+
+
+def _fetch_court_detail(
+    session: requests.Session, item: AuctionItem
+) -> Tuple[Dict[str, Any], float]:
+    resp = session.get(item.detail_url, timeout=10)
+    resp.raise_for_status()
+
+    started = time.perf_counter()
+    data = parse_court_detail_status(
+        resp.content, item.auction_date, court_response_encoding(resp)
+    )
+    return data, (time.perf_counter() - started) * 1000
+
+
+def fetch_court_detail_statuses(
+    items: List[AuctionItem],
+    metrics: Optional[Dict[str, Any]] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    상세 페이지를 bounded thread pool로 병렬 조회한다.
+    반환: {item.pk: 상태 데이터}
+    """
+    targets = [item for item in items if item.detail_url]
+    if not targets:
+        return {}
+
+    workers = max(1, getattr(settings, "COURT_DETAIL_WORKERS", 8))
+    session = _create_court_detail_session(workers)
+
+    statuses: Dict[int, Dict[str, Any]] = {}
+    parse_times: List[float] = []
+    failed = 0
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_fetch_court_detail, session, item): item
+                for item in targets
+            }
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    data, parse_ms = future.result()
+                except Exception:
+                    failed += 1
+                    continue
+                parse_times.append(parse_ms)
+                if data:
+                    statuses[item.pk] = data
+    finally:
+        session.close()
+
+    if metrics is not None:
+        metrics["detail_fetched"] = len(parse_times)
+        metrics["detail_failed"] = failed
+        metrics["detail_resolved"] = len(statuses)
+        metrics["detail_parse_ms_avg"] = (
+            round(sum(parse_times) / len(parse_times), 2) if parse_times else 0
+        )
+        metrics["detail_parse_ms_max"] = (
+            round(max(parse_times), 2) if parse_times else 0
+        )
+
+    return statuses
+
+
+def fetch_court_item_statuses(
+    items: List[AuctionItem],
+    metrics: Optional[Dict[str, Any]] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    여러 매물의 현재 상태를 조회한다.
+    법원 코드별로 묶어 그룹 검색을 먼저 하고, 찾지 못한 매물만 상세 페이지로 fallback.
+    반환: {item.pk: 상태 데이터}
+    """
+    statuses: Dict[int, Dict[str, Any]] = {}
+
+    groups: Dict[str, List[AuctionItem]] = {}
+    fallback: List[AuctionItem] = []
+    for item in items:
+        if item.court_code and item.auction_date:
+            groups.setdefault(item.court_code, []).append(item)
+        else:
+            fallback.append(item)
 
+    session = None
+    try:
+        for court_code, group in groups.items():
+            if len(group) < COURT_GROUP_SEARCH_MIN_ITEMS:
+                fallback.extend(group)
+                continue
+
+            if session is None:
+                session = _create_court_session()
+
+            found = _search_court_statuses(
+                session,
+                court_code,
+                min(item.auction_date for item in group),
+                max(item.auction_date for item in group),
+                {item.external_id for item in group},
+            )
+            for item in group:
+                if item.external_id in found:
+                    statuses[item.pk] = found[item.external_id]
+                else:
+                    fallback.append(item)
+    finally:
+        if session is not None:
+            session.close()
+
+    if metrics is not None:
+        metrics["grouped_resolved"] = len(statuses)
+
+    statuses.update(fetch_court_detail_statuses(fallback, metrics))
+    return statuses
+
+
+def fetch_court_item_status(item: AuctionItem) -> Dict[str, Any]:
+    return fetch_court_item_statuses([item]).get(item.pk, {})
+
+
+#  4. 날짜 기반 상태 전이 (재크롤링 없이 SQL로 처리)
+
+# (전이 이름, 현재 상태, 다음 상태, 경매일 조건)
+# map_court_status와 같은 기준: 경매일이 오늘 이후면 PLANNED, 지나면 ACTIVE
+AUCTION_STATUS_TRANSITIONS = [
+    (
+        "planned_to_active",
+        AuctionItem.Status.PLANNED,
+        AuctionItem.Status.ACTIVE,
+        lambda today: {"auction_date__lt": today},
+    ),
+]
+
+
+def advance_auction_status(note: str = "") -> CrawlJob:
+    """
+    경매일 경과에 따른 상태 전이를 set-based UPDATE로 일괄 반영한다.
+    - 외부 HTTP 호출 없음
+    - 전이별 변경 건수는 CrawlJob.metrics에 기록
+    """
+    job = CrawlJob.objects.create(
+        source=CrawlJob.Source.COURT,
+        status=CrawlJob.Status.RUNNING,
+        started_at=timezone.now(),
+        note=note or "날짜 기반 상태 전이",
+    )
 
-def fetch_court_item_status(external_id: str) -> Dict[str, Any]:
-    # 법원 경매 상태 갱신 로직은 실제 페이지를 다시 파싱해야 하므로 복잡도가 높음.
-    # 현재는 기본 뼈대만 유지하고, 필요 시 상세 구현 추가 필요.
-    return {}
+    try:
+        today = date.today()
+        counts: Dict[str, int] = {}
+
+        with transaction.atomic():
+            for name, from_status, to_status, date_filter in AUCTION_STATUS_TRANSITIONS:
+                # 전이 + 상태 변경 이벤트를 한 문장으로 처리
+                counts[name] = transition_item_status(
+                    AuctionItem.objects.filter(
+                        status=from_status, **date_filter(today)
+                    ),
+                    to_status,
+                )
+
+        job.updated_count = sum(counts.values())
+        job.metrics = {"transitions": counts}
+        if job.updated_count:
+            from alerts.matching import bump_items_generation
+
+            bump_items_generation()
+        job.status = CrawlJob.Status.SUCCESS
+
+    except Exception as e:
+        job.status = CrawlJob.Status.FAILED
+        job.error_message = str(e)[:1000]
+
+    finally:
+        job.finished_at = timezone.now()
+        job.save()
+
+    return job
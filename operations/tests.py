@@ -1 +1,105 @@
-# Create your tests here.
+from datetime import date
+
+from django.test import SimpleTestCase
+from requests import Response
+
+from operations.services import (
+    _crawl_court_rows,
+    court_response_encoding,
+    parse_court_detail_status,
+)
+
+DETAIL_HTML = (
+    "<html><head>{meta}</head><body><table>"
+    "<tr><th>유찰 횟수</th><td>2회</td></tr>"
+    "<tr><th>물건상태</th><td>매각허가결정</td></tr>"
+    "</table></body></html>"
+)
+
+
+def _response(content: bytes, content_type: str) -> Response:
+    resp = Response()
+    resp._content = content
+    resp.headers["Content-Type"] = content_type
+    resp.encoding = (
+        content_type.split("charset=")[1] if "charset=" in content_type else None
+    )
+    return resp
+
+
+class CourtDetailEncodingTests(SimpleTestCase):
+    def _parse(self, resp: Response) -> dict:
+        return parse_court_detail_status(
+            resp.content, encoding=court_response_encoding(resp)
+        )
+
+    def test_charset_only_in_header(self):
+        for charset in ("utf-8", "euc-kr"):
+            with self.subTest(charset=charset):
+                content = DETAIL_HTML.format(meta="").encode(charset)
+                resp = _response(content, f"text/html; charset={charset}")
+                data = self._parse(resp)
+                self.assertEqual(data["num_failures"], 2)
+                self.assertEqual(data["raw_status"], "매각허가결정")
+
+    def test_charset_only_in_meta(self):
+        meta = '<meta http-equiv="Content-Type" content="text/html; charset=euc-kr">'
+        content = DETAIL_HTML.format(meta=meta).encode("euc-kr")
+        data = self._parse(_response(content, "text/html"))
+        self.assertEqual(data["num_failures"], 2)
+
+    def test_no_charset_defaults_to_euc_kr(self):
+        content = DETAIL_HTML.format(meta="").encode("euc-kr")
+        resp = _response(content, "text/html")
+        self.assertEqual(court_response_encoding(resp), "euc-kr")
+        self.assertEqual(self._parse(resp)["num_failures"], 2)
+
+
+class _FakeCourtSession:
+    def __init__(self, pages):
+        self.pages = list(pages)
+
+    def post(self, url, json=None, timeout=None):
+        resp = Response()
+        resp.status_code = 200
+        resp._content = b"{}"
+        page = self.pages.pop(0)
+        resp.json = lambda: page
+        return resp
+
+
+def _listing(rows, total):
+    return {
+        "status": 200,
+        "data": {"dlt_srchResult": rows, "dma_pageInfo": {"totalCnt": str(total)}},
+    }
+
+
+class CourtCrawlCompletionTests(SimpleTestCase):
+    def _crawl(self, *pages):
+        return _crawl_court_rows(
+            _FakeCourtSession(pages), "000210", date(2026, 1, 1), date(2026, 1, 31)
+        )
+
+    def test_empty_listing_is_complete(self):
+        rows, stats = self._crawl(_listing([], 0))
+        self.assertEqual(rows, [])
+        self.assertTrue(stats["completed"])
+
+    def test_all_pages_is_complete(self):
+        rows, stats = self._crawl(_listing([{}] * 40, 41), _listing([{}], 41))
+        self.assertEqual(len(rows), 41)
+        self.assertTrue(stats["completed"])
+
+    def test_error_payloads_are_not_complete(self):
+        for page in (
+            {"status": 500, "message": "점검 중", "data": None},
+            {"errors": [{"message": "error"}]},
+            {"data": {}},
+            {"data": {"dlt_srchResult": []}},
+            _listing([], 25),
+        ):
+            with self.subTest(page=page):
+                _, stats = self._crawl(page)
+                self.assertFalse(stats["completed"])
+                self.assertTrue(stats["error"])
@@ -5,6 +5,7 @@ from .views import (
     CrawlJobDetailView,
     CrawlJobListView,
     RunCourtCrawlJobView,
+    RunStatusAdvanceJobView,
     RunStatusRefreshJobView,
 )
 
@@ -16,4 +17,5 @@ urlpatterns = [
     path("item-logs/", CrawlItemLogListView.as_view(), name="crawlitemlog-list"),
     path("crawl/court/", RunCourtCrawlJobView.as_view(), name="crawl-court"),
     path("status-refresh/", RunStatusRefreshJobView.as_view(), name="status-refresh"),
+    path("status-advance/", RunStatusAdvanceJobView.as_view(), name="status-advance"),
 ]
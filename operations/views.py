@@ -9,7 +9,7 @@ from .serializers import (
     CrawlJobDetailSerializer,
     CrawlJobListSerializer,
 )
-from .services import run_crawl_job, run_status_refresh_job
+from .services import advance_auction_status, run_crawl_job, run_status_refresh_job
 
 
 class AdminOnly(permissions.IsAdminUser):
@@ -75,3 +75,12 @@ class RunStatusRefreshJobView(APIView):
         job = run_status_refresh_job(source=normalized_source)
         data = CrawlJobDetailSerializer(job).data
         return Response(data, status=status.HTTP_201_CREATED)
+
+
+class RunStatusAdvanceJobView(APIView):
+    permission_classes = [AdminOnly]
+
+    def post(self, request):
+        job = advance_auction_status()
+        data = CrawlJobDetailSerializer(job).data
+        return Response(data, status=status.HTTP_201_CREATED)